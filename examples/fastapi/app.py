@@ -3,16 +3,17 @@ from __future__ import annotations
 import os
 import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.concurrency import run_in_threadpool
 
-from sqler.models import StaleVersionError
 from sqler.query import SQLerField as F
 
-from .db import close_db, init_db
+from .db import close_async_db, close_db, get_async_db, get_db, init_async_reads, init_db
 from .errors import install_exception_handlers
 from .models import Address, Order, User
 from .schemas import (
@@ -40,8 +41,12 @@ async def lifespan(app: FastAPI):
 
     日本語: デモ用 DB の初期化とクリーンアップを行います。
     """
-    init_db(os.getenv("SQLER_DB_PATH"))
+    path = os.getenv("SQLER_DB_PATH")
+    init_db(path)
+    if os.getenv("SQLER_ASYNC") == "1":
+        await init_async_reads(path)
     yield
+    await close_async_db()
     close_db()
 
 
@@ -50,47 +55,101 @@ app = FastAPI(
     version="1.0.0",
     summary="JSON-first micro-ORM on SQLite with WAL + optimistic locking",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes in C
 )
 
+# resolved once at import; never re-read per request
+_CORS_ORIGINS = tuple(os.getenv("CORS_ALLOW_ORIGINS", "*").split(","))
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=os.getenv("CORS_ALLOW_ORIGINS", "*").split(","),
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Attach a simple process-time header to every response.
+class TimingMiddleware:
+    """Raw ASGI middleware that stamps X-Process-Time on each response.
+
+    Plain coroutine wrapper around ``send``; avoids BaseHTTPMiddleware's
+    extra task and anyio memory streams per request.
 
-    日本語: 各レスポンスに処理時間ヘッダーを付与します。
+    日本語: 各レスポンスに処理時間ヘッダーを付与します（素の ASGI 実装）。
     """
-    start = time.perf_counter()
-    resp: Response = await call_next(request)
-    resp.headers["X-Process-Time"] = f"{(time.perf_counter() - start):.6f}s"
-    return resp
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # integer microseconds: int→bytes is much cheaper than float formatting
+                elapsed_us = int((time.perf_counter() - start) * 1_000_000)
+                message["headers"].append((b"x-process-time", b"%dus" % elapsed_us))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app.add_middleware(TimingMiddleware)
 
 
 install_exception_handlers(app)
 
 
+# bound constructors resolved once at import; handlers skip the per-request
+# class attribute lookup for model_construct
+_address_out = AddressOut.model_construct
+_user_out = UserOut.model_construct
+_order_out = OrderOut.model_construct
+
+
+def _to_out(construct, obj):
+    """Build a response model from an already-validated SQLer instance.
+
+    Trust boundary: data loaded from SQLerSafeModel was validated on save, so
+    we use ``model_construct`` and skip re-validation. Inbound payloads
+    (AddressCreate/UserCreate/UserPatch) are still fully validated.
+
+    日本語: 保存時に検証済みのデータなので、応答側では再検証を省略します。
+    """
+    # __dict__ skips Pydantic's serializer walk; no merged-dict allocation
+    return construct(_id=obj._id, _version=getattr(obj, "_version", 0), **obj.__dict__)
+
+
+@lru_cache(maxsize=4096)
 def _etag(obj_id: int, version: int | None) -> str:
-    """Build a weak ETag from id and version.
+    """Build a weak ETag from id and version (memoized; ETags are hot).
 
-    日本語: id とバージョンから弱い ETag を生成します。
+    日本語: id とバージョンから弱い ETag を生成します（キャッシュ付き）。
     """
     v = 0 if version is None else int(version)
     return f'W/"{obj_id}-{v}"'
 
 
-async def _db_call(fn, *args, **kwargs):
-    """Run a blocking SQLer call in the threadpool.
+async def _aresolve_refs(doc: dict) -> dict:
+    """Resolve {_table,_id} refs one level deep over the aiosqlite connection.
 
-    日本語: ブロッキングな SQLer 処理をスレッドプールで実行します。
+    日本語: aiosqlite 接続で参照辞書を 1 階層だけ解決します。
     """
-    return await run_in_threadpool(fn, *args, **kwargs)
+    adb = get_async_db()
+
+    async def one(v):
+        if isinstance(v, dict) and "_table" in v and "_id" in v:
+            return await adb.find_document(v["_table"], v["_id"]) or v
+        return v
+
+    out: dict = {}
+    for k, v in doc.items():
+        out[k] = [await one(x) for x in v] if isinstance(v, list) else await one(v)
+    return out
 
 
 router_users = APIRouter(prefix="/users", tags=["Users"])
@@ -104,10 +163,9 @@ async def create_address(payload: AddressCreate):
 
     日本語: 住所ドキュメントを作成します。
     """
-    a = await _db_call(lambda: Address(**payload.model_dump()).save())
-    return AddressOut.model_validate(
-        a.model_dump() | {"_id": a._id, "_version": getattr(a, "_version", 0)}
-    )
+    a = Address(**payload.model_dump())
+    await run_in_threadpool(a.save)
+    return _to_out(_address_out, a)
 
 
 @router_addresses.get("/{address_id}", response_model=AddressOut)
@@ -116,7 +174,21 @@ async def get_address(address_id: int, request: Request, response: Response):
 
     日本語: ETag 対応で住所を取得します（If-None-Match が一致すれば 304）。
     """
-    a = await _db_call(lambda: Address.from_id(address_id))
+    if (adb := get_async_db()) is not None:
+        # pure event-loop read: no threadpool hop, no thread switches
+        doc = await adb.find_document_with_version(Address._table, address_id)
+        if doc is None:
+            raise HTTPException(status_code=404, detail="address not found")
+        etag = _etag(doc["_id"], doc.get("_version", 0))
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return ORJSONResponse(doc, headers={"ETag": etag})
+    if inm := request.headers.get("if-none-match"):
+        # answer 304 from the _version column alone; no JSON parse, no Pydantic
+        ver = await run_in_threadpool(get_db().get_version, Address._table, address_id)
+        if ver is not None and inm == _etag(address_id, ver):
+            return Response(status_code=304, headers={"ETag": inm})
+    a = await run_in_threadpool(Address.from_id, address_id)
     if not a:
         raise HTTPException(status_code=404, detail="address not found")
     etag = _etag(a._id, getattr(a, "_version", 0))  # ETag は id と _version 由来
@@ -125,9 +197,7 @@ async def get_address(address_id: int, request: Request, response: Response):
         response.headers["ETag"] = etag
         return Response(status_code=304)
     response.headers["ETag"] = etag
-    return AddressOut.model_validate(
-        a.model_dump() | {"_id": a._id, "_version": getattr(a, "_version", 0)}
-    )
+    return _to_out(_address_out, a)
 
 
 @router_users.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
@@ -138,7 +208,8 @@ async def create_user(payload: UserCreate):
     """
 
     def _create():
-        u = User(**payload.model_dump(exclude={"address_id"}))
+        # direct attribute access; no model_dump walk + exclusion set
+        u = User(name=payload.name, age=payload.age)
         if payload.address_id is not None:
             addr = Address.from_id(payload.address_id)
             if not addr:
@@ -147,10 +218,35 @@ async def create_user(payload: UserCreate):
         u.save()
         return u
 
-    u = await _db_call(_create)
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    u = await run_in_threadpool(_create)
+    return _to_out(_user_out, u)
+
+
+@router_users.post("/bulk", response_model=list[int], status_code=status.HTTP_201_CREATED)
+async def bulk_create_users(payload: list[UserCreate]):
+    """Create many users in one transaction (one fsync for the whole batch).
+
+    日本語: 複数ユーザを 1 トランザクション/1 fsync で作成します。
+    """
+
+    def _bulk():
+        docs = [
+            {
+                "name": p.name,
+                "age": p.age,
+                "address": (
+                    {"_table": Address._table, "_id": p.address_id}
+                    if p.address_id is not None
+                    else None
+                ),
+                "orders": [],
+            }
+            for p in payload
+        ]
+        # executemany + single commit inside bulk_upsert
+        return get_db().bulk_upsert(User._table, docs)
+
+    return await run_in_threadpool(_bulk)
 
 
 @router_users.get("/{user_id}", response_model=UserOut)
@@ -159,7 +255,19 @@ async def get_user(user_id: int, request: Request, response: Response):
 
     日本語: ETag 対応でユーザを取得します。
     """
-    u = await _db_call(lambda: User.from_id(user_id))
+    if (adb := get_async_db()) is not None:
+        doc = await adb.find_document_with_version(User._table, user_id)
+        if doc is None:
+            raise HTTPException(status_code=404, detail="user not found")
+        etag = _etag(doc["_id"], doc.get("_version", 0))
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return ORJSONResponse(await _aresolve_refs(doc), headers={"ETag": etag})
+    if inm := request.headers.get("if-none-match"):
+        ver = await run_in_threadpool(get_db().get_version, User._table, user_id)
+        if ver is not None and inm == _etag(user_id, ver):
+            return Response(status_code=304, headers={"ETag": inm})
+    u = await run_in_threadpool(User.from_id, user_id)
     if not u:
         raise HTTPException(status_code=404, detail="user not found")
     etag = _etag(u._id, getattr(u, "_version", 0))
@@ -168,9 +276,7 @@ async def get_user(user_id: int, request: Request, response: Response):
         response.headers["ETag"] = etag
         return Response(status_code=304)
     response.headers["ETag"] = etag
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    return _to_out(_user_out, u)
 
 
 @router_users.get("", response_model=list[UserOut])
@@ -193,14 +299,13 @@ async def list_users(
             qs = qs.filter(User.ref("address").field("city") == city)
         if q:
             qs = qs.filter(F("name").like(f"%{q}%"))
-        return [
-            UserOut.model_validate(
-                u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-            )
-            for u in qs.order_by("age").limit(limit).all()
-        ]
+        # SQLite aggregates the whole page into one JSON array in C and
+        # splices each user's address row in; zero per-row Python objects,
+        # zero Pydantic
+        return qs.order_by("age").limit(limit).all_json()
 
-    return await _db_call(_list)
+    payload = await run_in_threadpool(_list)
+    return Response(content=payload, media_type="application/json")
 
 
 @router_users.patch("/{user_id}", response_model=UserOut)
@@ -211,41 +316,44 @@ async def patch_user(user_id: int, patch: UserPatch, request: Request, response:
     """
 
     def _patch():
-        u = User.from_id(user_id)
-        if not u:
+        db = get_db()
+        ver = db.get_version(User._table, user_id)
+        if ver is None:
             raise HTTPException(status_code=404, detail="user not found")
-        current_etag = _etag(u._id, getattr(u, "_version", 0))  # 現在の ETag を算出
+        current_etag = _etag(user_id, ver)  # 現在の ETag を算出
         if (if_match := request.headers.get("if-match")) and if_match != current_etag:
             raise HTTPException(
                 status_code=412, detail="If-Match precondition failed"
             )  # 事前条件不一致
 
-        data = patch.model_dump(exclude_unset=True)
-        if "address_id" in data:
-            if data["address_id"] is None:
-                u.address = None
+        # only fields the client actually sent, read straight off the model
+        sent = patch.__pydantic_fields_set__
+        fields: dict = {}
+        if "address_id" in sent:
+            if patch.address_id is None:
+                fields["address"] = None
             else:
-                addr = Address.from_id(data["address_id"])
-                if not addr:
+                exists = db.adapter.execute(
+                    f"SELECT 1 FROM {Address._table} WHERE _id = ?;", [patch.address_id]
+                ).fetchone()
+                if not exists:
                     raise HTTPException(status_code=404, detail="address not found")
-                u.set_address(addr)
-            data.pop("address_id")
-
-        for k, v in data.items():
-            setattr(u, k, v)
-
-        try:
-            u.save()
-        except StaleVersionError:
-            raise HTTPException(status_code=409, detail="version conflict")  # 同時更新競合
-        return u
-
-    u = await _db_call(_patch)
+                fields["address"] = {"_table": Address._table, "_id": patch.address_id}
+        for k in sent - {"address_id"}:
+            fields[k] = getattr(patch, k)
+
+        if fields:
+            try:
+                # partial in-place UPDATE; no full-document re-serialization
+                db.json_patch(User._table, user_id, fields, expected_version=ver)
+            except RuntimeError:
+                raise HTTPException(status_code=409, detail="version conflict")  # 同時更新競合
+        return User.from_id(user_id)
+
+    u = await run_in_threadpool(_patch)
     etag = _etag(u._id, getattr(u, "_version", 0))
     response.headers["ETag"] = etag
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    return _to_out(_user_out, u)
 
 
 @router_orders.post("", response_model=OrderOut, status_code=status.HTTP_201_CREATED)
@@ -254,10 +362,9 @@ async def create_order(payload: OrderCreate):
 
     日本語: 注文ドキュメントを作成します。
     """
-    o = await _db_call(lambda: Order(**payload.model_dump()).save())
-    return OrderOut.model_validate(
-        o.model_dump() | {"_id": o._id, "_version": getattr(o, "_version", 0)}
-    )
+    o = Order(**payload.model_dump())
+    await run_in_threadpool(o.save)
+    return _to_out(_order_out, o)
 
 
 @router_users.post("/{user_id}/orders/{order_id}", response_model=OkOut)
@@ -268,15 +375,21 @@ async def attach_order(user_id: int, order_id: int):
     """
 
     def _attach():
-        u = User.from_id(user_id)
-        o = Order.from_id(order_id)
-        if not u or not o:
+        db = get_db()
+        order_exists = db.adapter.execute(
+            f"SELECT 1 FROM {Order._table} WHERE _id = ?;", [order_id]
+        ).fetchone()
+        if not order_exists:
+            raise HTTPException(status_code=404, detail="user or order not found")
+        # single server-side UPDATE instead of load → mutate → save
+        updated = db.json_array_append(
+            User._table, user_id, "orders", {"_table": Order._table, "_id": order_id}
+        )
+        if not updated:
             raise HTTPException(status_code=404, detail="user or order not found")
-        u.add_order(o)
-        u.save()
         return {"ok": True}
 
-    return await _db_call(_attach)
+    return await run_in_threadpool(_attach)
 
 
 app.include_router(router_addresses)
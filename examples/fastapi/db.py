@@ -3,8 +3,7 @@ from __future__ import annotations
 from typing import Optional
 
 from sqler import SQLerDB
-
-from .models import Address, Order, User
+from sqler.db.async_db import AsyncSQLerDB
 
 """
 DB bootstrap utilities for the FastAPI example.
@@ -14,6 +13,7 @@ English: Create/close a process-wide SQLerDB and bind models.
 """
 
 _db: Optional[SQLerDB] = None
+_async_db: Optional[AsyncSQLerDB] = None
 
 
 def init_db(path: str | None = None):
@@ -24,6 +24,10 @@ def init_db(path: str | None = None):
     global _db
     if _db is not None:
         return _db
+    # deferred: importing models triggers Pydantic's model build; keep that
+    # cost out of module import for tools that only need schemas
+    from .models import Address, Order, User
+
     _db = SQLerDB.on_disk(path) if path else SQLerDB.in_memory(shared=False)
 
     User.set_db(_db)
@@ -48,6 +52,41 @@ def get_db() -> SQLerDB:
     return _db
 
 
+async def init_async_reads(path: str | None) -> Optional[AsyncSQLerDB]:
+    """Open an aiosqlite connection for read endpoints (set SQLER_ASYNC=1).
+
+    Point reads served on the event loop skip the threadpool round trip.
+    Requires an on-disk DB so sync writers and async readers share state.
+
+    日本語: 読み取り専用の aiosqlite 接続を開きます（SQLER_ASYNC=1 で有効）。
+    """
+    global _async_db
+    if path is None or _async_db is not None:
+        return _async_db
+    _async_db = AsyncSQLerDB.on_disk(path)
+    await _async_db.connect()
+    return _async_db
+
+
+def get_async_db() -> Optional[AsyncSQLerDB]:
+    """Return the async read DB, or None when not enabled.
+
+    日本語: 有効な場合のみ非同期読み取り用 DB を返します。
+    """
+    return _async_db
+
+
+async def close_async_db() -> None:
+    """Close the async read connection if open.
+
+    日本語: 非同期読み取り接続をクローズします。
+    """
+    global _async_db
+    if _async_db is not None:
+        await _async_db.close()
+        _async_db = None
+
+
 def close_db() -> None:
     """Close and clear the global DB.
 
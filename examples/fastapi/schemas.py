@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 """
 Pydantic request/response schemas for the FastAPI example.
@@ -28,6 +28,8 @@ class AddressOut(AddressCreate):
     日本語: id とバージョン付き Address レスポンス。
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     _id: int
     _version: int
 
@@ -60,6 +62,8 @@ class UserOut(BaseModel):
     日本語: id/バージョンと解決済み参照を含む User レスポンス。
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     _id: int
     _version: int
     name: str
@@ -84,6 +88,8 @@ class OrderOut(OrderCreate):
     日本語: id/バージョン付き Order レスポンス。
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     _id: int
     _version: int
 
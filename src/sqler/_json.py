@@ -0,0 +1,32 @@
+"""Internal JSON codec for document payloads.
+
+Uses orjson (Rust, no Python-level recursion) when installed, falling back
+to the stdlib. Install with ``sqler[speed]`` to get the fast path.
+``dumps`` always returns ``str`` so payloads bind as TEXT — binding
+orjson's raw bytes would make newer SQLite treat them as JSONB.
+"""
+
+from typing import Any
+
+try:
+    import orjson as _orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string via orjson."""
+        return _orjson.dumps(obj).decode()
+
+    loads = _orjson.loads
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    import json as _stdlib_json
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string via the stdlib.
+
+        Compact separators match orjson's output, so stored payloads keep
+        the minified shape regardless of codec (referrer scans LIKE-match
+        against it).
+        """
+        return _stdlib_json.dumps(obj, separators=(",", ":"))
+
+    loads = _stdlib_json.loads
@@ -1,5 +1,12 @@
 from .abstract import AdapterABC, NotConnectedError
+from .async_pool import AsyncAdapterPool
 from .asynchronous import AsyncSQLiteAdapter
 from .synchronous import SQLiteAdapter
 
-__all__ = ["AdapterABC", "SQLiteAdapter", "AsyncSQLiteAdapter", "NotConnectedError"]
+__all__ = [
+    "AdapterABC",
+    "SQLiteAdapter",
+    "AsyncSQLiteAdapter",
+    "AsyncAdapterPool",
+    "NotConnectedError",
+]
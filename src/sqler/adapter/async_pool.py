@@ -0,0 +1,91 @@
+import asyncio
+import contextlib
+from typing import Any, AsyncIterator, Callable, List, Optional, Self
+
+import aiosqlite
+
+from sqler.adapter.asynchronous import AsyncSQLiteAdapter
+
+
+class AsyncAdapterPool:
+    """Pool of warm :class:`AsyncSQLiteAdapter` connections.
+
+    Each aiosqlite connection owns a worker thread, so opening one per task
+    (or per test) pays thread spin-up plus PRAGMA setup every time. The pool
+    keeps ``min_size`` connections warm and hands them out round-robin,
+    growing on demand up to ``max_size``.
+
+    Opt-in: ``AsyncSQLerDB`` keeps its single-connection adapter by default;
+    use the pool directly when many tasks hammer the same database::
+
+        pool = AsyncAdapterPool.on_disk("app.db", min_size=2, max_size=8)
+        await pool.connect()
+        async with pool.acquire() as adapter:
+            await adapter.execute(...)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], AsyncSQLiteAdapter],
+        min_size: int = 2,
+        max_size: int = 8,
+    ):
+        if min_size < 1 or max_size < min_size:
+            raise ValueError("pool sizes must satisfy 1 <= min_size <= max_size")
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._queue: asyncio.Queue[AsyncSQLiteAdapter] = asyncio.Queue()
+        self._size = 0
+        self._connected = False
+
+    async def connect(self) -> None:
+        """Warm ``min_size`` connections concurrently."""
+        if self._connected:
+            return
+        adapters = [self._factory() for _ in range(self._min_size)]
+        await asyncio.gather(*(a.connect() for a in adapters))
+        for adapter in adapters:
+            self._queue.put_nowait(adapter)
+        self._size = len(adapters)
+        self._connected = True
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncSQLiteAdapter]:
+        """Check a warm adapter out of the pool; returns it on exit."""
+        if not self._connected:
+            await self.connect()
+        if self._queue.empty() and self._size < self._max_size:
+            adapter = self._factory()
+            await adapter.connect()
+            self._size += 1
+        else:
+            adapter = await self._queue.get()
+        try:
+            yield adapter
+        finally:
+            self._queue.put_nowait(adapter)
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None) -> aiosqlite.Cursor:
+        """Acquire, run one statement, and release."""
+        async with self.acquire() as adapter:
+            return await adapter.execute(query, params)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        while self._size:
+            adapter = await self._queue.get()
+            await adapter.close()
+            self._size -= 1
+        self._connected = False
+
+    # factories mirroring AsyncSQLiteAdapter's
+    @classmethod
+    def in_memory(cls, min_size: int = 2, max_size: int = 8) -> Self:
+        # shared-cache URI so every pooled connection sees the same database
+        return cls(lambda: AsyncSQLiteAdapter.in_memory(shared=True), min_size, max_size)
+
+    @classmethod
+    def on_disk(cls, path: str = "sqler.db", min_size: int = 2, max_size: int = 8) -> Self:
+        # on_disk PRAGMAs already set WAL/synchronous=NORMAL/cache_size
+        return cls(lambda: AsyncSQLiteAdapter.on_disk(path), min_size, max_size)
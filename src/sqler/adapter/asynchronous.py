@@ -1,3 +1,4 @@
+import sqlite3
 from typing import Any, List, Optional, Self
 
 import aiosqlite
@@ -12,7 +13,7 @@ class AsyncSQLiteAdapter:
         self.pragmas = pragmas or []
 
     async def connect(self) -> None:
-        self.connection = await aiosqlite.connect(self.path, uri=True)
+        self.connection = await aiosqlite.connect(self.path, uri=True, cached_statements=1024)
         # ensure row returns tuples, not dicts
         await self.connection.execute("PRAGMA foreign_keys = ON")
         for pragma in self.pragmas:
@@ -30,6 +31,64 @@ class AsyncSQLiteAdapter:
         cursor = await self.connection.execute(query, params or [])
         return cursor
 
+    async def execute_commit(
+        self, query: str, params: Optional[List[Any]] = None
+    ) -> aiosqlite.Cursor:
+        """Execute a write and commit it in a single worker-thread submission.
+
+        Every awaited aiosqlite call is one hop through the connection's
+        worker queue, so the usual execute-then-commit pair pays two
+        scheduling round trips. Fusing both onto the worker halves that
+        latency for autocommit-style writes.
+        """
+        if not self.connection:
+            await self.connect()
+
+        def _run() -> sqlite3.Cursor:
+            raw = self.connection._conn
+            cursor = raw.execute(query, params or [])
+            raw.commit()
+            return cursor
+
+        try:
+            cursor = await self.connection._execute(_run)
+        except AttributeError:  # aiosqlite internals moved; take the two-hop path
+            cursor = await self.connection.execute(query, params or [])
+            await self.connection.commit()
+            return cursor
+        return aiosqlite.Cursor(self.connection, cursor)
+
+    async def execute_fetchone_commit(
+        self, query: str, params: Optional[List[Any]] = None
+    ) -> tuple[Optional[tuple], Optional[int]]:
+        """Run a statement, fetch its first row, and commit in one submission.
+
+        Companion to :meth:`execute_commit` for RETURNING-style writes: the
+        row must be fetched before the commit, which would otherwise cost
+        three worker-queue hops. Returns ``(row, lastrowid)``.
+        """
+        if not self.connection:
+            await self.connect()
+
+        def _run() -> tuple[Optional[tuple], Optional[int]]:
+            raw = self.connection._conn
+            cursor = raw.execute(query, params or [])
+            row = cursor.fetchone()
+            lastrowid = cursor.lastrowid
+            raw.commit()
+            cursor.close()
+            return row, lastrowid
+
+        try:
+            return await self.connection._execute(_run)
+        except AttributeError:  # aiosqlite internals moved; take the slow path
+            cursor = await self.connection.execute(query, params or [])
+            row = await cursor.fetchone()
+            lastrowid = cursor.lastrowid
+            await self.connection.commit()
+            await cursor.close()
+            return row, lastrowid
+
     async def executemany(self, query: str, param_list: List[List[Any]]) -> aiosqlite.Cursor:
         if not self.connection:
             await self.connect()
@@ -64,8 +123,9 @@ class AsyncSQLiteAdapter:
 
     # factories
     @classmethod
-    def in_memory(cls, shared: bool = True) -> Self:
+    def in_memory(cls, shared: bool = True, page_size: int = 16384) -> Self:
         pragmas = [
+            f"PRAGMA page_size = {page_size}",
             "PRAGMA foreign_keys = ON",
             "PRAGMA synchronous = OFF",
             "PRAGMA journal_mode = MEMORY",
@@ -77,14 +137,16 @@ class AsyncSQLiteAdapter:
         return cls(uri, pragmas=pragmas)
 
     @classmethod
-    def on_disk(cls, path: str = "sqler.db") -> Self:
+    def on_disk(cls, path: str = "sqler.db", page_size: int = 8192) -> Self:
+        # page_size only takes effect on newly created files (set before WAL)
         pragmas = [
+            f"PRAGMA page_size = {page_size}",
             "PRAGMA foreign_keys = ON",
             "PRAGMA busy_timeout = 5000",
             "PRAGMA journal_mode = WAL",
             "PRAGMA synchronous = NORMAL",
             "PRAGMA cache_size = -64000",
-            "PRAGMA wal_autocheckpoint = 1000",
+            "PRAGMA wal_autocheckpoint = 10000",
             "PRAGMA mmap_size = 268435456",
             "PRAGMA temp_store = MEMORY",
         ]
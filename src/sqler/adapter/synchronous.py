@@ -1,5 +1,6 @@
 import sqlite3
 import threading
+from contextlib import contextmanager
 from typing import Any, Optional, Self
 
 from .abstract import AdapterABC, NotConnectedError
@@ -30,7 +31,9 @@ class SQLiteAdapter(AdapterABC):
             raise NotConnectedError("Database not connected, call connect() first")
         if self._memory_singleton:
             if self._single_conn is None:
-                self._single_conn = sqlite3.connect(self.path, uri=True, check_same_thread=False)
+                self._single_conn = sqlite3.connect(
+                    self.path, uri=True, check_same_thread=False, cached_statements=1024
+                )
                 self._single_conn.row_factory = sqlite3.Row
                 cur = self._single_conn.cursor()
                 for pragma in self.pragmas:
@@ -40,7 +43,7 @@ class SQLiteAdapter(AdapterABC):
         conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
         if conn is not None:
             return conn
-        conn = sqlite3.connect(self.path, uri=True, check_same_thread=False)
+        conn = sqlite3.connect(self.path, uri=True, check_same_thread=False, cached_statements=1024)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         for pragma in self.pragmas:
@@ -103,6 +106,31 @@ class SQLiteAdapter(AdapterABC):
         conn.commit()
         return cursor
 
+    @contextmanager
+    def write_tx(self):
+        """Run a write transaction that takes the reserved lock up front.
+
+        ``BEGIN IMMEDIATE`` acquires the write lock before the first
+        statement, so concurrent writers queue on busy_timeout instead of
+        failing with SQLITE_BUSY mid-transaction. Commits on success,
+        rolls back on error. No-op when already inside a transaction.
+        """
+        conn = self._conn()
+        if conn.in_transaction:
+            yield self
+            return
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            yield self
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        else:
+            conn.commit()
+
     def commit(self) -> None:
         """Commit the current transaction."""
         conn = self._conn()
@@ -132,9 +160,10 @@ class SQLiteAdapter(AdapterABC):
     ### factories
 
     @classmethod
-    def in_memory(cls, shared: bool = True) -> Self:
+    def in_memory(cls, shared: bool = True, page_size: int = 16384) -> Self:
         """Connects to an in memory db with some pragmas applied"""
         pragmas = [
+            f"PRAGMA page_size = {page_size}",
             "PRAGMA foreign_keys = ON",
             "PRAGMA synchronous = OFF",
             "PRAGMA journal_mode = MEMORY",
@@ -149,21 +178,21 @@ class SQLiteAdapter(AdapterABC):
         return cls(uri, pragmas=pragmas)
 
     @classmethod
-    def on_disk(cls, path: str = "sqler.db") -> Self:
-        """Connects (creates if not exist) a db on disk with some pragmas applied"""
+    def on_disk(cls, path: str = "sqler.db", page_size: int = 8192) -> Self:
+        """Connects (creates if not exist) a db on disk with some pragmas applied
+
+        page_size only takes effect on newly created files (it must be set
+        before WAL mode); existing databases keep their page size.
+        """
         pragmas = [
+            f"PRAGMA page_size = {page_size}",
             "PRAGMA foreign_keys = ON",
             "PRAGMA busy_timeout = 5000",
             "PRAGMA journal_mode = WAL",
             "PRAGMA synchronous = NORMAL",
             "PRAGMA cache_size = -64000",
-            "PRAGMA wal_autocheckpoint = 1000",
+            "PRAGMA wal_autocheckpoint = 10000",
             "PRAGMA mmap_size = 268435456",
             "PRAGMA temp_store = MEMORY",
         ]
         return cls(path, pragmas=pragmas)
-
-
-class _LockedCursor:
-    # Deprecated: no longer used with thread-local connections (kept for history)
-    pass
@@ -1,6 +1,6 @@
-import json
 from typing import Any, Optional
 
+from sqler import _json
 from sqler.adapter.asynchronous import AsyncSQLiteAdapter
 
 
@@ -19,6 +19,9 @@ class AsyncSQLerDB:
 
     def __init__(self, adapter: AsyncSQLiteAdapter):
         self.adapter = adapter
+        # cache of tables already ensured to exist / to be versioned
+        self._ensured: set[str] = set()
+        self._versioned_tables: set[str] = set()
 
     async def connect(self) -> None:
         await self.adapter.connect()
@@ -27,49 +30,85 @@ class AsyncSQLerDB:
         await self.adapter.close()
 
     async def _ensure_table(self, table: str) -> None:
+        if table in self._ensured:
+            return
         ddl = f"""
         CREATE TABLE IF NOT EXISTS {table} (
             _id INTEGER PRIMARY KEY AUTOINCREMENT,
             data JSON NOT NULL
         );
         """
-        await self.adapter.execute(ddl)
-        await self.adapter.commit()
+        # executescript commits internally: one submission instead of two
+        await self.adapter.executescript(ddl)
+        self._ensured.add(table)
 
     async def insert_document(self, table: str, doc: dict[str, Any]) -> int:
         await self._ensure_table(table)
-        payload = json.dumps(doc)
-        cur = await self.adapter.execute(f"INSERT INTO {table} (data) VALUES (json(?));", [payload])
-        await self.adapter.commit()
+        payload = _json.dumps(doc)
+        cur = await self.adapter.execute_commit(
+            f"INSERT INTO {table} (data) VALUES (?);", [payload]
+        )
         last_id = cur.lastrowid  # type: ignore[attr-defined]
         await cur.close()
         return last_id
 
     async def upsert_document(self, table: str, _id: Optional[int], doc: dict[str, Any]) -> int:
         await self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _json.dumps(doc)
         if _id is None:
             return await self.insert_document(table, doc)
-        cur = await self.adapter.execute(
-            f"UPDATE {table} SET data = json(?) WHERE _id = ?;", [payload, _id]
+        cur = await self.adapter.execute_commit(
+            f"UPDATE {table} SET data = ? WHERE _id = ?;", [payload, _id]
         )
-        await self.adapter.commit()
         await cur.close()
         return _id
 
+    async def bulk_upsert(self, table: str, docs: list[dict[str, Any]]) -> list[int]:
+        """Upsert multiple documents in one transaction.
+
+        Async mirror of :meth:`SQLerDB.bulk_upsert`: docs with ``_id`` are
+        updated, the rest inserted, with one commit for the whole batch.
+        On SQLite's single-writer connection this beats fanning saves out
+        concurrently, which would just queue on the same worker thread.
+
+        Returns:
+            list[int]: The ``_id`` for each input document, preserving order.
+        """
+        await self._ensure_table(table)
+        query = (
+            f"INSERT INTO {table} (_id, data) VALUES (?, ?) "
+            f"ON CONFLICT(_id) DO UPDATE SET data = excluded.data RETURNING _id;"
+        )
+        ids: list[int] = []
+        async with self.adapter:
+            for doc in docs:
+                payload = _json.dumps({k: v for k, v in doc.items() if k != "_id"})
+                cur = await self.adapter.execute(query, [doc.get("_id"), payload])
+                row = await cur.fetchone()
+                await cur.close()
+                ids.append(row[0])
+        for doc, doc_id in zip(docs, ids):
+            doc["_id"] = doc_id
+        return ids
+
     async def find_document(self, table: str, _id: int) -> Optional[dict[str, Any]]:
+        # cached set lookup in steady state; a never-written table must
+        # read as None, not raise OperationalError
         await self._ensure_table(table)
-        cur = await self.adapter.execute(f"SELECT _id, data FROM {table} WHERE _id = ?;", [_id])
+        # _id is merged into the JSON by SQLite: one loads(), no dict mutation
+        cur = await self.adapter.execute(
+            f"SELECT json_set(data, '$._id', _id) FROM {table} WHERE _id = ?;", [_id]
+        )
         row = await cur.fetchone()
         await cur.close()
         if not row:
             return None
-        obj = json.loads(row[1])
-        obj["_id"] = row[0]
-        return obj
+        return _json.loads(row[0])
 
     # ---- versioned (optimistic locking) helpers ----
     async def _ensure_versioned_table(self, table: str) -> None:
+        if table in self._versioned_tables:
+            return
         await self._ensure_table(table)
         cur = await self.adapter.execute(f"PRAGMA table_info({table});")
         cols = [row[1] for row in await cur.fetchall()]
@@ -80,51 +119,44 @@ class AsyncSQLerDB:
             )
             await self.adapter.commit()
             await cur2.close()
+        self._versioned_tables.add(table)
 
     async def upsert_with_version(
         self, table: str, _id: Optional[int], doc: dict[str, Any], expected_version: Optional[int]
     ) -> tuple[int, int]:
         await self._ensure_versioned_table(table)
-        payload = json.dumps(doc)
+        payload = _json.dumps(doc)
         if _id is None:
-            cur = await self.adapter.execute(
-                f"INSERT INTO {table} (data, _version) VALUES (json(?), 0);",
+            _, last_id = await self.adapter.execute_fetchone_commit(
+                f"INSERT INTO {table} (data, _version) VALUES (?, 0);",
                 [payload],
             )
-            await self.adapter.commit()
-            last_id = cur.lastrowid  # type: ignore[attr-defined]
-            await cur.close()
             return last_id, 0
         if expected_version is None:
             raise ValueError("expected_version required for update")
-        cur = await self.adapter.execute(
-            f"UPDATE {table} SET data = json(?), _version = _version + 1 WHERE _id = ? AND _version = ?;",
+        # single-statement CAS: fetch the RETURNING row and commit in one
+        # worker submission instead of three
+        row, _ = await self.adapter.execute_fetchone_commit(
+            f"UPDATE {table} SET data = ?, _version = _version + 1 "
+            f"WHERE _id = ? AND _version = ? RETURNING _version;",
             [payload, _id, expected_version],
         )
-        await self.adapter.commit()
-        await cur.close()
-        # Check changes() to confirm update actually happened
-        ch = await self.adapter.execute("SELECT changes();")
-        row = await ch.fetchone()
-        await ch.close()
-        if not row or int(row[0]) == 0:
+        if row is None:
             raise RuntimeError("Stale version: update rejected")
-        return _id, expected_version + 1
+        return _id, int(row[0])
 
     async def find_document_with_version(self, table: str, _id: int) -> Optional[dict[str, Any]]:
         await self._ensure_versioned_table(table)
         cur = await self.adapter.execute(
-            f"SELECT _id, data, _version FROM {table} WHERE _id = ?;",
+            f"SELECT json_set(data, '$._id', _id, '$._version', _version) "
+            f"FROM {table} WHERE _id = ?;",
             [_id],
         )
         row = await cur.fetchone()
         await cur.close()
         if not row:
             return None
-        obj = json.loads(row[1])
-        obj["_id"] = row[0]
-        obj["_version"] = row[2]
-        return obj
+        return _json.loads(row[0])
 
     async def query(self, table: str):
         """Convenience: return an AsyncSQLerQuery bound to this adapter."""
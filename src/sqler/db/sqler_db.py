@@ -1,7 +1,8 @@
-import json
 import threading
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, ClassVar, Iterator, Optional
 
+from sqler import _json
 from sqler.adapter import SQLiteAdapter
 from sqler.query import SQLerQuery
 
@@ -15,6 +16,31 @@ class SQLerDB:
     on demand as you insert or query.
     """
 
+    # CRUD statement templates, formatted once per table via _sql()
+    _SQL_TEMPLATES: ClassVar[dict[str, str]] = {
+        "insert": "INSERT INTO {table} (data) VALUES (?);",
+        # RETURNING merges the insert and the read-back into one statement
+        "insert_returning": (
+            "INSERT INTO {table} (data) VALUES (?) RETURNING _id, json_set(data, '$._id', _id);"
+        ),
+        "update": "UPDATE {table} SET data = ? WHERE _id = ?;",
+        # _id is merged into the JSON by SQLite so Python does one loads()
+        # with no dict mutation afterwards
+        "find": "SELECT json_set(data, '$._id', _id) FROM {table} WHERE _id = ?;",
+        "find_raw": "SELECT data FROM {table} WHERE _id = ?;",
+        "delete": "DELETE FROM {table} WHERE _id = ?;",
+        "insert_versioned": "INSERT INTO {table} (data, _version) VALUES (?, 0);",
+        "update_versioned": (
+            "UPDATE {table} SET data = ?, _version = _version + 1 "
+            "WHERE _id = ? AND _version = ? RETURNING _version;"
+        ),
+        "get_version": "SELECT _version FROM {table} WHERE _id = ?;",
+        "find_versioned": (
+            "SELECT json_set(data, '$._id', _id, '$._version', _version) "
+            "FROM {table} WHERE _id = ?;"
+        ),
+    }
+
     @classmethod
     def in_memory(cls, shared: bool = True) -> "SQLerDB":
         """Create a SQLerDB backed by an in-memory SQLite database.
@@ -47,23 +73,101 @@ class SQLerDB:
         self.adapter.connect()
         # serialize DDL operations (e.g., adding _version) across threads
         self._ddl_lock = threading.RLock()
-        # cache of tables already ensured to be versioned
+        # cache of tables already ensured to exist / to be versioned, so the
+        # CREATE TABLE IF NOT EXISTS + commit pair runs once per process
+        self._ensured: set[str] = set()
         self._versioned_tables: set[str] = set()
+        # tables checked against the schema and found without _version;
+        # _ensure_versioned_table clears entries when it adds the column
+        self._unversioned_tables: set[str] = set()
+        # per-thread flag set while inside transaction(); suppresses the
+        # implicit per-call commits so writes batch into one fsync
+        self._txn = threading.local()
+        # formatted CRUD SQL per (op, table): keeps statement text stable so
+        # sqlite3's prepared-statement cache hits, and skips per-call format
+        self._sql_cache: dict[tuple[str, str], str] = {}
+        # writes per table since the last ANALYZE; see _note_writes
+        self._writes_since_analyze: dict[str, int] = {}
+
+    def _sql(self, op: str, table: str) -> str:
+        """Return the cached CRUD statement for ``(op, table)``."""
+        key = (op, table)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            sql = self._SQL_TEMPLATES[op].format(table=table)
+            self._sql_cache[key] = sql
+        return sql
+
+    # refresh planner statistics once per this many writes to a table
+    _ANALYZE_THRESHOLD: ClassVar[int] = 1000
+
+    def _commit(self) -> None:
+        """Commit unless batching inside :meth:`transaction`."""
+        if not getattr(self._txn, "active", False):
+            self.adapter.commit()
+
+    def _note_writes(self, table: str, n: int = 1) -> None:
+        """Count writes per table and re-ANALYZE past a threshold.
+
+        Join ordering for relationship queries leans on ``sqlite_stat1``;
+        without stats the planner guesses which side of a join to probe.
+        Counting writes here keeps the refresh amortized to one ANALYZE
+        per :attr:`_ANALYZE_THRESHOLD` rows written.
+        """
+        count = self._writes_since_analyze.get(table, 0) + n
+        if count >= self._ANALYZE_THRESHOLD:
+            self.adapter.execute(f"ANALYZE {table};")
+            self._commit()
+            count = 0
+        self._writes_since_analyze[table] = count
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLerDB"]:
+        """Batch multiple writes into a single transaction and commit.
+
+        Inside the block, document calls (insert/upsert/delete/patch) skip
+        their implicit per-call commit; everything commits once on exit or
+        rolls back on error. On disk databases this turns one fsync per row
+        into one per batch, e.g.::
+
+            with db.transaction():
+                for m in models:
+                    m.save()
+
+        Reentrant: nested blocks join the outer transaction. Single calls
+        outside the block still commit immediately.
+        """
+        if getattr(self._txn, "active", False):
+            yield self
+            return
+        self._txn.active = True
+        try:
+            with self.adapter.write_tx():
+                yield self
+        finally:
+            self._txn.active = False
 
     def _ensure_table(self, table: str) -> None:
         """Create the target table if it doesn't exist.
 
+        Cached: after the first call per table this is a set lookup, not a
+        round trip to SQLite.
+
         Args:
             table: Table name to ensure.
         """
+        if table in self._ensured:
+            return
         ddl = f"""
         CREATE TABLE IF NOT EXISTS {table} (
             _id INTEGER PRIMARY KEY AUTOINCREMENT,
             data JSON NOT NULL
         );
         """
-        self.adapter.execute(ddl)
-        self.adapter.commit()
+        # executescript auto-commits, so this one-time setup path skips the
+        # separate commit round trip
+        self.adapter.executescript(ddl)
+        self._ensured.add(table)
 
     def insert_document(self, table: str, doc: dict[str, Any]) -> int:
         """Insert a document.
@@ -76,11 +180,34 @@ class SQLerDB:
             int: Newly assigned ``_id``.
         """
         self._ensure_table(table)
-        payload = json.dumps(doc)
-        cursor = self.adapter.execute(f"INSERT INTO {table} (data) VALUES (json(?));", [payload])
-        self.adapter.commit()
+        payload = _json.dumps(doc)
+        cursor = self.adapter.execute(self._sql("insert", table), [payload])
+        self._commit()
+        self._note_writes(table)
         return cursor.lastrowid
 
+    def insert_and_return(self, table: str, doc: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Insert a document and fetch it back in one statement.
+
+        Saves the second round-trip of the common insert-then-find pattern
+        by using ``RETURNING``; the returned dict includes ``_id`` just like
+        :meth:`find_document`.
+
+        Args:
+            table: Table name.
+            doc: JSON-serializable dict to persist.
+
+        Returns:
+            tuple[int, dict]: Assigned ``_id`` and the stored document.
+        """
+        self._ensure_table(table)
+        payload = _json.dumps(doc)
+        cursor = self.adapter.execute(self._sql("insert_returning", table), [payload])
+        row = cursor.fetchone()
+        self._commit()
+        self._note_writes(table)
+        return row[0], _json.loads(row[1])
+
     def upsert_document(self, table: str, _id: Optional[int], doc: dict[str, Any]) -> int:
         """Insert or update a document.
 
@@ -93,11 +220,12 @@ class SQLerDB:
             int: The existing or newly assigned ``_id``.
         """
         self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _json.dumps(doc)
         if _id is None:
             return self.insert_document(table, doc)
-        self.adapter.execute(f"UPDATE {table} SET data = json(?) WHERE _id = ?;", [payload, _id])
-        self.adapter.commit()
+        self.adapter.execute(self._sql("update", table), [payload, _id])
+        self._commit()
+        self._note_writes(table)
         return _id
 
     def bulk_upsert(self, table: str, docs: list[dict[str, Any]]) -> list[int]:
@@ -115,39 +243,45 @@ class SQLerDB:
             list[int]: The ``_id`` for each input document, preserving order.
         """
         self._ensure_table(table)
-        params = []
-        new_docs = []
-
-        for doc in docs:
-            doc_id = doc.get("_id")
-            payload_dict = {k: v for k, v in doc.items() if k != "_id"}
-            payload = json.dumps(payload_dict)
-            if doc_id is None:
-                params.append((None, payload))
-                new_docs.append(doc)
-            else:
-                params.append((doc_id, payload))
-
-        query = f"""
-            INSERT INTO {table} (_id, data)
-            VALUES (?, json(?))
-            ON CONFLICT(_id) DO UPDATE SET data = excluded.data
-        """
-
-        with self.adapter as adapter:
-            cursor = adapter.execute(f"SELECT COALESCE(MAX(_id), 0) FROM {table};")
-            max_id_before = cursor.fetchone()[0]
-            adapter.executemany(query, params)
-            cursor = adapter.execute(f"SELECT MAX(_id) FROM {table};")
-            max_id_after = cursor.fetchone()[0]
+        query = (
+            f"INSERT INTO {table} (_id, data) VALUES (?, ?) "
+            f"ON CONFLICT(_id) DO UPDATE SET data = excluded.data RETURNING _id;"
+        )
+        ids: list[int] = []
+        # RETURNING hands back each row's id directly, so ids map to docs
+        # positionally without MAX(_id) range inference
+        with self.adapter.write_tx():
+            for doc in docs:
+                payload = _json.dumps({k: v for k, v in doc.items() if k != "_id"})
+                cur = self.adapter.execute(query, [doc.get("_id"), payload])
+                ids.append(cur.fetchone()[0])
+        for doc, doc_id in zip(docs, ids):
+            doc["_id"] = doc_id
+        self._note_writes(table, len(docs))
+        return ids
+
+    def bulk_insert_documents(self, table: str, docs: list[dict[str, Any]]) -> list[int]:
+        """Insert many documents in a single transaction.
+
+        Amortizes SQL parsing (one cached statement) and the commit fsync
+        across the whole batch instead of paying both per row.
 
-        if new_docs:
-            expected_new = max_id_after - max_id_before
-            assert expected_new == len(new_docs), "Mismatch in _id assignment count"
-            for doc, new_id in zip(new_docs, range(max_id_before + 1, max_id_after + 1)):
-                doc["_id"] = new_id
+        Args:
+            table: Table name.
+            docs: JSON-serializable dicts to persist.
 
-        return [doc.get("_id") for doc in docs]
+        Returns:
+            list[int]: Assigned ``_id`` for each document, in input order.
+        """
+        self._ensure_table(table)
+        query = f"INSERT INTO {table} (data) VALUES (?) RETURNING _id;"
+        ids: list[int] = []
+        with self.adapter.write_tx():
+            for doc in docs:
+                cur = self.adapter.execute(query, [_json.dumps(doc)])
+                ids.append(cur.fetchone()[0])
+        self._note_writes(table, len(docs))
+        return ids
 
     def find_document(self, table: str, _id: int) -> Optional[dict[str, Any]]:
         """Fetch a document by id.
@@ -160,14 +294,33 @@ class SQLerDB:
             dict | None: Decoded document with ``_id`` merged in, or ``None``
             if not found.
         """
+        # cached set lookup in steady state; keeps reads against
+        # never-written tables returning None instead of OperationalError
         self._ensure_table(table)
-        cur = self.adapter.execute(f"SELECT _id, data FROM {table} WHERE _id = ?;", [_id])
+        cur = self.adapter.execute(self._sql("find", table), [_id])
         row = cur.fetchone()
         if not row:
             return None
-        obj = json.loads(row[1])
-        obj["_id"] = row[0]
-        return obj
+        return _json.loads(row[0])
+
+    def find_document_raw(self, table: str, _id: int) -> Optional[str]:
+        """Fetch a document's stored JSON text without decoding it.
+
+        Lets callers with a faster decoder (e.g. msgspec) skip the dict
+        round trip entirely. ``_id`` is not merged in; the caller already
+        knows it.
+
+        Args:
+            table: Table name.
+            _id: Row id to fetch.
+
+        Returns:
+            str | None: Raw JSON text, or ``None`` if not found.
+        """
+        self._ensure_table(table)
+        cur = self.adapter.execute(self._sql("find_raw", table), [_id])
+        row = cur.fetchone()
+        return row[0] if row else None
 
     def delete_document(self, table: str, _id: int) -> None:
         """Delete a document by id.
@@ -177,8 +330,90 @@ class SQLerDB:
             _id: Row id to delete.
         """
         self._ensure_table(table)
-        self.adapter.execute(f"DELETE FROM {table} WHERE _id = ?;", [_id])
-        self.adapter.commit()
+        self.adapter.execute(self._sql("delete", table), [_id])
+        self._commit()
+
+    def json_array_append(self, table: str, _id: int, path: str, value: Any) -> int:
+        """Append a value to a JSON array field in a single UPDATE.
+
+        Avoids the read-modify-write round trip: SQLite appends server-side
+        via ``json_insert`` (creating the array when missing). On versioned
+        tables ``_version`` is bumped so optimistic locking stays coherent.
+
+        Args:
+            table: Table name.
+            _id: Row id to modify.
+            path: Dotted JSON path of the array field (e.g., ``"orders"``).
+            value: JSON-serializable value to append.
+
+        Returns:
+            int: Number of rows updated (0 when the row does not exist).
+        """
+        self._ensure_table(table)
+        payload = _json.dumps(value)
+        set_expr = (
+            f"json_set(data, '$.{path}', "
+            f"json_insert(coalesce(json_extract(data, '$.{path}'), '[]'), '$[#]', json(?)))"
+        )
+        version_sql = ", _version = _version + 1" if self._table_is_versioned(table) else ""
+        cur = self.adapter.execute(
+            f"UPDATE {table} SET data = {set_expr}{version_sql} WHERE _id = ?;",
+            [payload, _id],
+        )
+        self._commit()
+        return cur.rowcount
+
+    def json_patch(
+        self,
+        table: str,
+        _id: int,
+        fields: dict[str, Any],
+        expected_version: Optional[int] = None,
+    ) -> int:
+        """Update individual JSON fields in place with a single ``json_set``.
+
+        Skips the load/merge/re-dump cycle for partial updates; only the
+        named paths are rewritten. With ``expected_version`` the update is a
+        compare-and-swap against the ``_version`` column.
+
+        Args:
+            table: Table name.
+            _id: Row id to patch.
+            fields: Mapping of dotted JSON paths to new values.
+            expected_version: When given, update only if the stored version
+                matches; ``_version`` is incremented on success.
+
+        Returns:
+            int: The new version when ``expected_version`` was given,
+            otherwise the number of rows updated.
+
+        Raises:
+            RuntimeError: On stale version conflicts (CAS mode only).
+        """
+        if not fields:
+            raise ValueError("json_patch requires at least one field")
+        self._ensure_table(table)
+        set_args = ", ".join(f"'$.{path}', json(?)" for path in fields)
+        params: list[Any] = [_json.dumps(v) for v in fields.values()]
+        params.append(_id)
+        if expected_version is None:
+            cur = self.adapter.execute(
+                f"UPDATE {table} SET data = json_set(data, {set_args}) WHERE _id = ?;",
+                params,
+            )
+            self._commit()
+            return cur.rowcount
+        params.append(expected_version)
+        with self.adapter.write_tx():
+            cur = self.adapter.execute(
+                f"UPDATE {table} SET data = json_set(data, {set_args}), "
+                f"_version = _version + 1 WHERE _id = ? AND _version = ? RETURNING _version;",
+                params,
+            )
+            row = cur.fetchone()
+        if row is None:
+            raise RuntimeError("Stale version: update rejected")
+        return int(row[0])
 
     def execute_sql(self, query: str, params: Optional[list[Any]] = None) -> list[dict[str, Any]]:
         """Run a custom SELECT and return decoded documents.
@@ -195,11 +430,13 @@ class SQLerDB:
         """
         cursor = self.adapter.execute(query, params or [])
         rows = cursor.fetchall()
-        docs = []
-        for row in rows:
-            obj = json.loads(row[1])
+        if not rows:
+            return []
+        # one large parse beats N small ones: join the stored JSON texts
+        # into a single array and decode in one C-level call
+        docs = _json.loads("[" + ",".join(row[1] for row in rows) + "]")
+        for row, obj in zip(rows, docs):
             obj["_id"] = row[0]
-            docs.append(obj)
         return docs
 
     def query(self, table: str) -> SQLerQuery:
@@ -216,7 +453,18 @@ class SQLerDB:
 
     def close(self):
         """Close the underlying adapter connection."""
+        try:
+            # cheap, self-limiting stats refresh recommended before close;
+            # tolerate adapters that were already closed by the caller
+            self.adapter.execute("PRAGMA optimize;")
+        except Exception:
+            pass
         self.adapter.close()
+        # a reconnected in-memory db starts empty; forget ensured schema so
+        # the next use re-runs the DDL
+        self._ensured.clear()
+        self._versioned_tables.clear()
+        self._unversioned_tables.clear()
 
     def connect(self):
         """Connect the underlying adapter if not already connected."""
@@ -229,6 +477,7 @@ class SQLerDB:
         unique: bool = False,
         name: Optional[str] = None,
         where: Optional[str] = None,
+        extracted: bool = False,
     ):
         """Create an index on a JSON field or literal column.
 
@@ -242,15 +491,39 @@ class SQLerDB:
             unique: Enforce uniqueness of the index.
             name: Optional index name; autogenerated if omitted.
             where: Optional partial-index WHERE clause.
+            extracted: Also materialize the JSON path as a generated column
+                ``x_<field>`` so raw SQL can reference the extracted value
+                by name. The index itself stays on the ``json_extract``
+                expression: the planner only matches the ORM's generated
+                SQL against expression indexes (indexes on an equivalent
+                generated column are ignored), and an expression index
+                already stores the extracted values — lookups served from
+                it never re-parse the JSON.
         """
+        import sqlite3 as _sqlite3
+
         self._ensure_table(table)
         idx_name = name or f"idx_{table}_{field.replace('.', '_')}"
         unique_sql = "UNIQUE" if unique else ""
-        expr = f"json_extract(data, '$.{field}')" if not field.startswith("_") else field
+        if not field.startswith("_"):
+            expr = f"json_extract(data, '$.{field}')"
+            if extracted:
+                # ALTER TABLE only allows VIRTUAL generated columns
+                col = f"x_{field.replace('.', '_')}"
+                try:
+                    self.adapter.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {col} AS ({expr}) VIRTUAL;"
+                    )
+                    self._commit()
+                except _sqlite3.OperationalError as exc:
+                    if "duplicate column" not in str(exc).lower():
+                        raise
+        else:
+            expr = field
         where_sql = f"WHERE {where}" if where else ""
         ddl = f"CREATE {unique_sql} INDEX IF NOT EXISTS {idx_name} ON {table} ({expr}) {where_sql};"
         self.adapter.execute(ddl)
-        self.adapter.commit()
+        self._commit()
 
     def drop_index(self, name: str):
         """Drop an index by name.
@@ -260,10 +533,30 @@ class SQLerDB:
         """
         ddl = f"DROP INDEX IF EXISTS {name};"
         self.adapter.execute(ddl)
-        self.adapter.commit()
+        self._commit()
 
     # ---- versioned (optimistic locking) helpers ----
 
+    def _table_is_versioned(self, table: str) -> bool:
+        """Return whether the table carries a ``_version`` column.
+
+        Decided from the actual schema, not from the in-process upgrade
+        cache: a fresh process opening an existing versioned file must
+        still bump versions on in-place writes. Both answers are cached,
+        so steady state is a set lookup per call.
+        """
+        if table in self._versioned_tables:
+            return True
+        if table in self._unversioned_tables:
+            return False
+        cur = self.adapter.execute(f'PRAGMA table_info("{table}");')
+        cols = {row[1] for row in cur.fetchall()}
+        if "_version" in cols:
+            self._versioned_tables.add(table)
+            return True
+        self._unversioned_tables.add(table)
+        return False
+
     def _ensure_versioned_table(self, table: str) -> None:
         """Ensure the target table exists and has a ``_version`` column.
 
@@ -291,6 +584,7 @@ class SQLerDB:
         if "_version" in cols:
             # mark cache and return
             self._versioned_tables.add(table)
+            self._unversioned_tables.discard(table)
             return
         # serialize DDL; re-check inside lock
         with self._ddl_lock:
@@ -310,9 +604,29 @@ class SQLerDB:
                 self.adapter.execute(
                     f'ALTER TABLE "{table}" ADD COLUMN "_version" INTEGER NOT NULL DEFAULT 0;'
                 )
-                self.adapter.commit()
+                self._commit()
             # update cache regardless
             self._versioned_tables.add(table)
+            self._unversioned_tables.discard(table)
+
+    def get_version(self, table: str, _id: int) -> Optional[int]:
+        """Return the stored ``_version`` for a row without reading its JSON.
+
+        Cheap scalar SELECT for conditional-request checks (ETag/If-Match)
+        that would otherwise pay a full document parse.
+
+        Args:
+            table: Table name.
+            _id: Row id.
+
+        Returns:
+            int | None: The version, or ``None`` when the row does not exist.
+        """
+        if table not in self._versioned_tables:
+            self._ensure_versioned_table(table)
+        cur = self.adapter.execute(self._sql("get_version", table), [_id])
+        row = cur.fetchone()
+        return int(row[0]) if row else None
 
     def upsert_with_version(
         self, table: str, _id: Optional[int], doc: dict[str, Any], expected_version: Optional[int]
@@ -336,38 +650,37 @@ class SQLerDB:
             ValueError: If updating with ``_id`` but ``expected_version`` is None.
             RuntimeError: On stale version conflicts (no rows updated).
         """
+        return self.upsert_with_version_raw(table, _id, _json.dumps(doc), expected_version)
+
+    def upsert_with_version_raw(
+        self, table: str, _id: Optional[int], payload: str, expected_version: Optional[int]
+    ) -> tuple[int, int]:
+        """Like :meth:`upsert_with_version` but takes pre-serialized JSON.
+
+        Retry loops (e.g. :meth:`SQLerSafeModel.save <sqler.models.safe.SQLerSafeModel.save>`)
+        hit this repeatedly with the same document; accepting the encoded
+        text lets them serialize once per payload change instead of once
+        per attempt. The statement text itself is cached, so SQLite reuses
+        the prepared statement across attempts.
+        """
         if table not in self._versioned_tables:
             self._ensure_versioned_table(table)
-        payload = json.dumps(doc)
         if _id is None:
-            cur = self.adapter.execute(
-                f"INSERT INTO {table} (data, _version) VALUES (json(?), 0);",
-                [payload],
-            )
-            self.adapter.commit()
+            cur = self.adapter.execute(self._sql("insert_versioned", table), [payload])
+            self._commit()
             return cur.lastrowid, 0
         if expected_version is None:
             raise ValueError("expected_version required for update")
-        # Acquire write lock early to reduce live-lock under contention
-        try:
-            self.adapter.execute("BEGIN IMMEDIATE;")
-        except Exception:
-            # tolerate if already in a transaction
-            pass
-        cur = self.adapter.execute(
-            f"UPDATE {table} SET data = json(?), _version = _version + 1 WHERE _id = ? AND _version = ?;",
-            [payload, _id, expected_version],
-        )
-        self.adapter.commit()
-        rc = getattr(cur, "rowcount", -1)
-        if rc <= 0:
-            # treat non-positive as conflict
-            # double-check via select
-            _ = self.adapter.execute(
-                f"SELECT _version FROM {table} WHERE _id = ?;", [_id]
-            ).fetchone()
+        # Acquire write lock early to reduce live-lock under contention;
+        # RETURNING makes the CAS a single round trip
+        with self.adapter.write_tx():
+            cur = self.adapter.execute(
+                self._sql("update_versioned", table), [payload, _id, expected_version]
+            )
+            row = cur.fetchone()
+        if row is None:
             raise RuntimeError("Stale version: update rejected")
-        return _id, expected_version + 1
+        return _id, int(row[0])
 
     def find_document_with_version(self, table: str, _id: int) -> Optional[dict[str, Any]]:
         """Fetch a document by id including ``_version`` in the result dict.
@@ -379,18 +692,10 @@ class SQLerDB:
         Returns:
             dict | None: Decoded document with ``_id`` and ``_version`` keys, or None.
         """
-        self._ensure_versioned_table(table)
-        cur = self.adapter.execute(f"SELECT _id, data, _version FROM {table} WHERE _id = ?;", [_id])
+        if table not in self._versioned_tables:
+            self._ensure_versioned_table(table)
+        cur = self.adapter.execute(self._sql("find_versioned", table), [_id])
         row = cur.fetchone()
         if not row:
             return None
-        try:
-            # Prefer name-based access for stability
-            obj = json.loads(row["data"])  # type: ignore[index]
-            obj["_id"] = row["_id"]  # type: ignore[index]
-            obj["_version"] = row["_version"]  # type: ignore[index]
-        except Exception:
-            obj = json.loads(row[1])
-            obj["_id"] = row[0]
-            obj["_version"] = row[2]
-        return obj
+        return _json.loads(row[0])
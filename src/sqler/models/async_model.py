@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, ClassVar, Optional, Type, TypeVar
+from typing import Any, ClassVar, Optional, Type, TypeVar, get_args, get_origin
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 
 from sqler import registry
 from sqler.db.async_db import AsyncSQLerDB
@@ -20,6 +20,13 @@ class AsyncSQLerModel(BaseModel):
     _id: Optional[int] = PrivateAttr(default=None)
     _db: ClassVar[Optional[AsyncSQLerDB]] = None
     _table: ClassVar[Optional[str]] = None
+    # (db, table) tuple cached at bind time
+    _binding: ClassVar[Optional[tuple[AsyncSQLerDB, str]]] = None
+    # whether any field could hold a ref; computed at bind time so querysets
+    # can skip relation resolution entirely for scalar-only models
+    _has_refs: ClassVar[bool] = True
+    # validates a whole result set in one pydantic-core call (built at bind)
+    _list_adapter: ClassVar[Optional[TypeAdapter]] = None
 
     model_config = {"extra": "ignore"}
 
@@ -32,13 +39,43 @@ class AsyncSQLerModel(BaseModel):
         if base in {"as"}:
             base = base + "_tbl"
         cls._table = table or base
+        # set_db(None) is the documented unbind/teardown idiom; a (None,
+        # table) tuple would sail past _require_binding's None check
+        cls._binding = (db, cls._table) if db is not None else None
+        cls._has_refs = cls._detect_has_refs()
+        cls._list_adapter = TypeAdapter(list[cls])
         registry.register(cls._table, cls)
 
+    @classmethod
+    def _detect_has_refs(cls) -> bool:
+        """Return True when any field annotation could carry a ref.
+
+        Refs are stored as ``{"_table": ..., "_id": ...}`` dicts, so only
+        model-, dict-, list- or Any-typed fields can hold them; models made
+        of plain scalars never need resolution.
+        """
+        scalars = (int, float, str, bool, bytes)
+
+        def may_hold_ref(tp: Any) -> bool:
+            if tp is None or tp is type(None):
+                return False
+            origin = get_origin(tp)
+            if origin is not None:
+                if origin in (dict, list, tuple, set, frozenset):
+                    return True
+                return any(may_hold_ref(a) for a in get_args(tp))
+            if isinstance(tp, type):
+                return not issubclass(tp, scalars)
+            return True  # Any or exotic constructs: stay conservative
+
+        return any(may_hold_ref(f.annotation) for f in cls.model_fields.values())
+
     @classmethod
     def _require_binding(cls) -> tuple[AsyncSQLerDB, str]:
-        if cls._db is None or cls._table is None:
+        binding = cls._binding
+        if binding is None:
             raise RuntimeError("Model is not bound. Call set_db(db, table?) first.")
-        return cls._db, cls._table
+        return binding
 
     @classmethod
     async def from_id(cls: Type[TAModel], id_: int) -> Optional[TAModel]:
@@ -69,14 +106,32 @@ class AsyncSQLerModel(BaseModel):
         self._id = new_id
         return self
 
+    @classmethod
+    async def bulk_save(cls: Type[TAModel], instances: list[TAModel]) -> list[TAModel]:
+        """Save many instances in one transaction and assign their ids.
+
+        Shares a single commit across the batch instead of one per save.
+        """
+        db, table = cls._require_binding()
+        docs = []
+        for inst in instances:
+            doc = await inst._adump_with_relations()
+            if inst._id is not None:
+                doc["_id"] = inst._id
+            docs.append(doc)
+        ids = await db.bulk_upsert(table, docs)
+        for inst, new_id in zip(instances, ids):
+            inst._id = new_id
+        return instances
+
     async def delete(self) -> None:
         cls = self.__class__
         db, table = cls._require_binding()
         if self._id is None:
             raise ValueError("Cannot delete unsaved model (missing _id)")
-        # reuse execute directly for delete to keep API small
-        await db.adapter.execute(f"DELETE FROM {table} WHERE _id = ?;", [self._id])
-        await db.adapter.commit()
+        # one fused execute+commit hop; keeps the API small
+        cur = await db.adapter.execute_commit(f"DELETE FROM {table} WHERE _id = ?;", [self._id])
+        await cur.close()
         self._id = None
 
     async def refresh(self: TAModel) -> TAModel:
@@ -131,10 +186,9 @@ class AsyncSQLerModel(BaseModel):
         return out
 
     async def _adump_with_relations(self) -> dict:
-        async def aencode(value: Any):
-            from sqler.models.async_model import AsyncSQLerModel
-            from sqler.models.model import SQLerModel
+        from sqler.models.model import SQLerModel
 
+        async def aencode(value: Any):
             if isinstance(value, AsyncSQLerModel):
                 if value._id is None:
                     raise ValueError("Related async model must be saved before saving parent")
@@ -156,9 +210,13 @@ class AsyncSQLerModel(BaseModel):
                 return value.model_dump()
             return value
 
+        # pydantic v2 stores declared fields in __dict__ (private attrs like
+        # _id live elsewhere), so iterating it skips the per-field getattr;
+        # scalars bypass aencode() (and its coroutine machinery) entirely
         payload: dict = {}
-        for name in self.__class__.model_fields:
-            if name == "_id":
-                continue
-            payload[name] = await aencode(getattr(self, name))
+        for name, value in self.__dict__.items():
+            if value is None or type(value) in (int, float, str, bool):
+                payload[name] = value
+            else:
+                payload[name] = await aencode(value)
         return payload
@@ -35,34 +35,43 @@ class AsyncSQLerQuerySet(Generic[T]):
         return self.__class__(self._model_cls, self._query.limit(n))
 
     # execution
+    def _should_resolve(self) -> bool:
+        # scalar-only models can never hold refs; skip the resolver walk
+        return self._resolve and getattr(self._model_cls, "_has_refs", True)
+
     async def all(self) -> list[T]:
         docs = await self._query.all_dicts()
-        if self._resolve:
+        if self._should_resolve():
             try:
                 docs = await self._abatch_resolve(docs)
             except Exception:
                 pass
-        results: list[T] = []
-        for d in docs:
-            if self._resolve:
+            resolved: list[dict] = []
+            for d in docs:
                 try:
-                    aresolver = getattr(self._model_cls, "_aresolve_relations")
-                    d = await aresolver(d)  # type: ignore[assignment]
-                except Exception:
+                    d = await self._model_cls._aresolve_relations(d)  # type: ignore[assignment]
+                except AttributeError:
                     pass
-            inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+                resolved.append(d)
+            docs = resolved
+        list_adapter = getattr(self._model_cls, "_list_adapter", None)
+        if list_adapter is not None:
+            # one pydantic-core call validates the whole list
+            results: list[T] = list_adapter.validate_python(docs)
+        else:
+            results = [self._model_cls.model_validate(d) for d in docs]  # type: ignore[attr-defined]
+        for inst, d in zip(results, docs):
             try:
                 inst._id = d.get("_id")  # type: ignore[attr-defined]
             except Exception:
                 pass
-            results.append(inst)
         return results
 
     async def first(self) -> Optional[T]:
         d = await self._query.first_dict()
         if d is None:
             return None
-        if self._resolve:
+        if self._should_resolve():
             try:
                 d = (await self._abatch_resolve([d]))[0]
             except Exception:
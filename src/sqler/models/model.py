@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Optional, Type, TypeVar
-
-from pydantic import BaseModel, PrivateAttr
-
-from sqler import registry
+import types
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ClassVar,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+
+try:  # optional speed dependency (install as sqler[speed])
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None
+
+from sqler import _json, registry
 from sqler.db.sqler_db import SQLerDB
 from sqler.models.queryset import SQLerQuerySet
+from sqler.models.ref import as_ref
 from sqler.query import SQLerExpression
 
 if TYPE_CHECKING:
@@ -15,6 +32,11 @@ if TYPE_CHECKING:
 TModel = TypeVar("TModel", bound="SQLerModel")
 
 
+# leaf types the relation walkers pass through untouched; an exact type()
+# membership test here replaces a cascade of isinstance checks per value
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _default_table_name(name: str) -> str:
     base = name.lower()
     if not base.endswith("s"):
@@ -25,6 +47,40 @@ def _default_table_name(name: str) -> str:
     return base
 
 
+# SQLerModelField is late-bound: importing it at module top would be
+# circular (model_field imports SQLerModel). Cached here so ref() pays
+# the sys.modules lookup once per process instead of once per call.
+_model_field_cls = None
+
+
+def _lazy_model_field():
+    global _model_field_cls
+    if _model_field_cls is None:
+        from .model_field import SQLerModelField
+
+        _model_field_cls = SQLerModelField
+    return _model_field_cls
+
+
+class _RefBuilder:
+    """Builder returned by :meth:`SQLerModel.ref`."""
+
+    def __init__(self, model_cls, base):
+        self.model_cls = model_cls
+        self.path = [base]
+
+    def field(self, *parts: str):
+        return _lazy_model_field()(self.model_cls, self.path + list(parts))
+
+    def any(self) -> "_RefAnyBuilder":
+        return _RefAnyBuilder(self.model_cls, self.path)
+
+
+class _RefAnyBuilder(_RefBuilder):
+    def field(self, *parts: str):
+        return _lazy_model_field()(self.model_cls, self.path + list(parts), array_any=True)
+
+
 class SQLerModel(BaseModel):
     """Pydantic-based model with persistence helpers for SQLerDB.
 
@@ -42,11 +98,36 @@ class SQLerModel(BaseModel):
     # class-bound db + table metadata
     _db: ClassVar[Optional[SQLerDB]] = None
     _table: ClassVar[Optional[str]] = None
+    # (db, table) tuple cached at bind time; _require_binding returns it
+    # without rebuilding a tuple per call
+    _binding: ClassVar[Optional[tuple[SQLerDB, str]]] = None
+    # whether any field could hold a ref or nested model (computed at bind
+    # time); scalar-only models can be hydrated without validation
+    _has_refs: ClassVar[bool] = True
+    # validates a whole result set in one pydantic-core call (built at bind)
+    _list_adapter: ClassVar[Optional[TypeAdapter]] = None
+    # declared field names snapshotted at bind; model_fields is a property
+    # that is too slow to re-walk on every refresh/dump
+    _field_names: ClassVar[tuple[str, ...]] = ()
+    # msgspec.Struct mirror for decoding raw JSON straight into typed
+    # attributes (None when msgspec is missing or the model holds refs)
+    _msgspec_struct: ClassVar[Optional[type]] = None
+    # exec-generated trusted loader with literal field names (see
+    # _build_fast_load); None for ref-holding models
+    _fast_load: ClassVar[Optional[Callable]] = None
+    # auto-create an expression index on each scalar ref's '$.<field>._id'
+    # path at bind time so relationship semi-joins probe an index instead
+    # of scanning. Indexes tax every INSERT/UPDATE on the table, so
+    # write-heavy models can opt out by setting this to False.
+    _auto_index_refs: ClassVar[bool] = True
 
     # ----- class config -----
     model_config = {
         "extra": "ignore",
         "frozen": False,
+        # skip eager SchemaValidator/Serializer construction at class
+        # definition; set_db builds it once when the model is actually used
+        "defer_build": True,
     }
 
     # ----- class methods -----
@@ -61,33 +142,90 @@ class SQLerModel(BaseModel):
         """
         cls._db = db
         cls._table = table or _default_table_name(cls.__name__)
-        cls._db._ensure_table(cls._table)
+        # set_db(None) unbinds; a (None, table) tuple would sail past
+        # _require_binding's None check
+        cls._binding = (db, cls._table) if db is not None else None
+        # deferred schema gets built here, once, instead of at import time
+        cls.model_rebuild(force=False)
+        cls._has_refs = cls._detect_has_refs()
+        cls._list_adapter = TypeAdapter(list[cls])
+        cls._field_names = tuple(n for n in cls.model_fields if n != "_id")
+        cls._msgspec_struct = cls._build_msgspec_struct()
+        cls._fast_load = cls._build_fast_load()
+        if db is None:
+            return
+        db._ensure_table(cls._table)
         registry.register(cls._table, cls)
+        if cls._auto_index_refs:
+            for fname in cls._scalar_ref_fields():
+                db.create_index(cls._table, f"{fname}._id")
 
-    # ergonomic relation field builder
     @classmethod
-    def ref(cls, name: str):
-        """Return a model-aware field builder for a related field name.
+    def _detect_has_refs(cls) -> bool:
+        """Return True when any field annotation could carry a ref.
 
-        Usage: User.ref("address").field("city") == "Kyoto"
+        Refs are stored as ``{"_table": ..., "_id": ...}`` dicts, so only
+        model-, dict-, list- or Any-typed fields can hold them; models made
+        of plain scalars never need resolution (or coercion on hydrate).
         """
-        from .model_field import SQLerModelField
+        scalars = (int, float, str, bool, bytes)
+
+        def may_hold_ref(tp: object) -> bool:
+            if tp is None or tp is type(None):
+                return False
+            origin = get_origin(tp)
+            if origin is not None:
+                if origin in (dict, list, tuple, set, frozenset):
+                    return True
+                return any(may_hold_ref(a) for a in get_args(tp))
+            if isinstance(tp, type):
+                return not issubclass(tp, scalars)
+            return True  # Any or exotic constructs: stay conservative
+
+        return any(may_hold_ref(f.annotation) for f in cls.model_fields.values())
 
-        class _RefBuilder:
-            def __init__(self, model_cls, base: str):
-                self.model_cls = model_cls
-                self.path = [base]
+    @classmethod
+    def _scalar_ref_fields(cls) -> tuple[str, ...]:
+        """Return field names annotated as a single related model.
 
-            def field(self, *parts: str) -> SQLerModelField:
-                return SQLerModelField(self.model_cls, self.path + list(parts))
+        Only direct annotations (``Address``) and optional unions
+        (``Address | None``) count; list-of-refs fields are excluded
+        because their ``.any()`` queries expand the array with json_each
+        and cannot be served by a single-path expression index.
+        """
+        return tuple(name for name, _ in cls._scalar_ref_tables())
+
+    @classmethod
+    def _scalar_ref_tables(cls) -> tuple[tuple[str, str], ...]:
+        """Return ``(field, related table)`` pairs for scalar ref fields.
 
-            def any(self) -> "_RefAnyBuilder":
-                return _RefAnyBuilder(self.model_cls, self.path)
+        The table comes from the related class's binding when it has one,
+        falling back to its default pluralized name otherwise.
+        """
+        pairs: list[tuple[str, str]] = []
+        for name, f in cls.model_fields.items():
+            ann = f.annotation
+            origin = get_origin(ann)
+            if origin in (Union, types.UnionType):
+                candidates = get_args(ann)
+            elif origin is None:
+                candidates = (ann,)
+            else:
+                continue
+            for c in candidates:
+                if isinstance(c, type) and issubclass(c, SQLerModel):
+                    table = c._table or _default_table_name(c.__name__)
+                    pairs.append((name, table))
+                    break
+        return tuple(pairs)
 
-        class _RefAnyBuilder(_RefBuilder):
-            def field(self, *parts: str) -> SQLerModelField:
-                return SQLerModelField(self.model_cls, self.path + list(parts), array_any=True)
+    # ergonomic relation field builder
+    @classmethod
+    def ref(cls, name: str):
+        """Return a model-aware field builder for a related field name.
 
+        Usage: User.ref("address").field("city") == "Kyoto"
+        """
         return _RefBuilder(cls, name)
 
     @classmethod
@@ -97,9 +235,100 @@ class SQLerModel(BaseModel):
         Raises:
             RuntimeError: If :meth:`set_db` has not been called.
         """
-        if cls._db is None or cls._table is None:
+        binding = cls._binding
+        if binding is None:
             raise RuntimeError("Model is not bound. Call set_db(db, table?) first.")
-        return cls._db, cls._table
+        return binding
+
+    @classmethod
+    def _build_msgspec_struct(cls) -> Optional[type]:
+        """Build a msgspec.Struct mirroring this model's fields, if possible.
+
+        msgspec decodes schematic JSON several times faster than a parse
+        plus pydantic validation, so scalar-only models use it to go from
+        stored text to typed attributes in one step. Returns ``None`` when
+        msgspec is not installed, the model may hold refs (those need
+        resolution and coercion), or the annotations aren't expressible as
+        a Struct.
+        """
+        if msgspec is None or cls._has_refs:
+            return None
+        try:
+            fields = []
+            for name, f in cls.model_fields.items():
+                if f.is_required():
+                    fields.append((name, f.annotation))
+                else:
+                    fields.append((name, f.annotation, f.default))
+            return msgspec.defstruct(f"_{cls.__name__}Struct", fields)
+        except Exception:
+            return None
+
+    @classmethod
+    def _build_fast_load(cls) -> Optional[Callable]:
+        """Generate a specialized loader for trusted row dicts.
+
+        Emits a function with one literal ``__dict__`` store per field (the
+        names are interned constants in the generated code) plus the three
+        ``object.__setattr__`` calls pydantic needs on a bypassed instance.
+        Roughly a hand-written ``__init__`` for this exact class; only built
+        for scalar-only models, where trusted hydration is safe at all.
+        """
+        if cls._has_refs:
+            return None
+        defaults = {}
+        factories = {}
+        lines = ["def _fast_load(d):", "    inst = _new(_cls)", "    d_get = d.get"]
+        for name, f in cls.model_fields.items():
+            if f.is_required():
+                lines.append(f"    inst.__dict__[{name!r}] = d_get({name!r})")
+            elif f.default_factory is not None:
+                # factory defaults run per instance; for these fields
+                # f.default is the PydanticUndefined sentinel and must
+                # never reach __dict__ when a row lacks the key
+                factories[name] = f.default_factory
+                lines.append(f"    v = d_get({name!r}, _undef)")
+                lines.append(
+                    f"    inst.__dict__[{name!r}] = _factories[{name!r}]() if v is _undef else v"
+                )
+            else:
+                defaults[name] = f.default
+                lines.append(f"    inst.__dict__[{name!r}] = d_get({name!r}, _defaults[{name!r}])")
+        lines += [
+            "    _osa(inst, '__pydantic_fields_set__', set(_fields))",
+            "    _osa(inst, '__pydantic_extra__', None)",
+            "    _osa(inst, '__pydantic_private__', _mk_private())",
+            "    return inst",
+        ]
+        # private attrs with factories likewise get a fresh value per
+        # instance instead of one bind-time get_default() shared (or left
+        # as the sentinel) across every hydrated row
+        private_static = {}
+        private_factories = {}
+        for name, attr in cls.__private_attributes__.items():
+            if attr.default_factory is not None:
+                private_factories[name] = attr.default_factory
+            else:
+                private_static[name] = attr.get_default()
+
+        def _mk_private():
+            out = dict(private_static)
+            for name, fn in private_factories.items():
+                out[name] = fn()
+            return out
+
+        ns = {
+            "_cls": cls,
+            "_new": cls.__new__,
+            "_osa": object.__setattr__,
+            "_fields": cls._field_names,
+            "_defaults": defaults,
+            "_factories": factories,
+            "_undef": object(),
+            "_mk_private": _mk_private,
+        }
+        exec("\n".join(lines), ns)
+        return ns["_fast_load"]
 
     @classmethod
     def from_id(cls: Type[TModel], id_: int) -> Optional[TModel]:
@@ -112,6 +341,19 @@ class SQLerModel(BaseModel):
             Model instance when found, else ``None``.
         """
         db, table = cls._require_binding()
+        struct_cls = cls._msgspec_struct
+        if struct_cls is not None:
+            raw = db.find_document_raw(table, id_)
+            if raw is None:
+                return None
+            try:
+                decoded = msgspec.json.decode(raw, type=struct_cls)
+            except Exception:
+                pass  # row doesn't match the struct; take the validating path
+            else:
+                inst = cls.model_construct(**{n: getattr(decoded, n) for n in cls._field_names})
+                inst._id = id_
+                return inst  # type: ignore[return-value]
         doc = db.find_document(table, id_)
         if doc is None:
             return None
@@ -179,6 +421,37 @@ class SQLerModel(BaseModel):
         self._id = new_id
         return self
 
+    @classmethod
+    def bulk_save(cls: Type[TModel], instances: list[TModel]) -> list[TModel]:
+        """Save many instances in one transaction and assign their ids.
+
+        Much faster than calling :meth:`save` in a loop: the writes share a
+        single commit instead of one per instance.
+
+        Args:
+            instances: Models to persist (mix of new and already-saved).
+
+        Returns:
+            list: The same instances, with ``_id`` set (for chaining).
+        """
+        db, table = cls._require_binding()
+        docs = []
+        all_new = True
+        for inst in instances:
+            doc = inst._dump_with_relations()
+            if inst._id is not None:
+                doc["_id"] = inst._id
+                all_new = False
+            docs.append(doc)
+        if all_new:
+            # plain INSERT path: no ON CONFLICT bookkeeping per row
+            ids = db.bulk_insert_documents(table, docs)
+        else:
+            ids = db.bulk_upsert(table, docs)
+        for inst, new_id in zip(instances, ids):
+            inst._id = new_id
+        return instances
+
     def delete(self) -> None:
         """Delete this instance by ``_id`` and unset it.
 
@@ -234,13 +507,17 @@ class SQLerModel(BaseModel):
         doc = db.find_document(table, self._id)
         if doc is None:
             raise LookupError(f"Row {self._id} not found for refresh")
-        doc = cls._resolve_relations(doc)
-        fresh = cls.model_validate(doc)  # type: ignore[call-arg]
-        # update fields in-place (excluding _id which is also present)
-        for fname in self.__class__.model_fields:
-            if fname == "_id":
-                continue
-            setattr(self, fname, getattr(fresh, fname))
+        if not cls._has_refs:
+            # trusted reload of a scalar-only model: write straight into
+            # __dict__, skipping validation and pydantic's per-field
+            # descriptor on setattr
+            self.__dict__.update({k: doc[k] for k in cls._field_names if k in doc})
+        else:
+            doc = cls._resolve_relations(doc)
+            fresh = cls.model_validate(doc)  # type: ignore[call-arg]
+            # update fields in-place (excluding _id which is also present)
+            for fname in cls._field_names:
+                setattr(self, fname, getattr(fresh, fname))
         # set db id explicitly
         self._id = doc.get("_id")
         return self
@@ -265,11 +542,9 @@ class SQLerModel(BaseModel):
                 [like1, like2],
             )
             rows = cur.fetchall()
-            import json
-
             for _id, data_json in rows:
                 try:
-                    data = json.loads(data_json)
+                    data = _json.loads(data_json)
                 except Exception:
                     continue
                 paths = cls._find_ref_paths(data, target_table, target_id)
@@ -298,14 +573,12 @@ class SQLerModel(BaseModel):
     def _set_null_referrers(
         cls, db: SQLerDB, target_table: str, target_id: int, referrers: list[tuple[str, int, dict]]
     ) -> None:
-        import json
-
         for table, row_id, meta in referrers:
             cur = db.adapter.execute(f"SELECT _id, data FROM {table} WHERE _id = ?;", [row_id])
             row = cur.fetchone()
             if not row:
                 continue
-            obj = json.loads(row[1])
+            obj = _json.loads(row[1])
 
             def replace(value):
                 if (
@@ -321,10 +594,10 @@ class SQLerModel(BaseModel):
                 return value
 
             new_obj = replace(obj)
-            payload = json.dumps(new_obj)
-            db.adapter.execute(
-                f"UPDATE {table} SET data = json(?) WHERE _id = ?;", [payload, row_id]
-            )
+            # _json writes minified text (the referrer LIKE scan depends on
+            # it), so the payload binds directly without a json(?) re-parse
+            payload = _json.dumps(new_obj)
+            db.adapter.execute(f"UPDATE {table} SET data = ? WHERE _id = ?;", [payload, row_id])
             db.adapter.commit()
 
     @classmethod
@@ -348,8 +621,6 @@ class SQLerModel(BaseModel):
         from . import BrokenRef as _BrokenRef
 
         broken: list[_BrokenRef] = []
-        import json
-
         for table in registry.tables().keys():
             exists = db.adapter.execute(
                 "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?;", [table]
@@ -359,7 +630,7 @@ class SQLerModel(BaseModel):
             cur = db.adapter.execute(f"SELECT _id, data FROM {table};")
             for _id, data_json in cur.fetchall():
                 try:
-                    data = json.loads(data_json)
+                    data = _json.loads(data_json)
                 except Exception:
                     continue
 
@@ -396,21 +667,63 @@ class SQLerModel(BaseModel):
     def _is_ref_dict(cls, value: object) -> bool:
         return isinstance(value, dict) and "_table" in value and "_id" in value
 
+    @staticmethod
+    def _holds_refs(value: object) -> bool:
+        """Iterative scan for anything the relation walkers would rewrite.
+
+        Returns True on the first nested ref dict (``{"_table": ..., "_id":
+        ...}``) or pydantic model instance; trees of plain scalars and
+        containers return False and can be passed through untouched, which
+        spares the walkers from reallocating every nested dict/list.
+        """
+        stack = [value]
+        while stack:
+            v = stack.pop()
+            if isinstance(v, dict):
+                if "_table" in v and "_id" in v:
+                    return True
+                stack.extend(v.values())
+            elif isinstance(v, (list, tuple)):
+                stack.extend(v)
+            elif isinstance(v, BaseModel):
+                return True
+        return False
+
     @classmethod
     def _resolve_relations(cls, data: dict) -> dict:
+        # common case: no refs anywhere -> hand the document back as-is
+        if not cls._holds_refs(data):
+            return data
+
+        registry_resolve = registry.resolve
+        # per-call memo: N refs to M tables cost M registry lookups, and the
+        # bound from_id is cached alongside (None = table has no loader)
+        loaders: dict = {}
+
+        # parsed JSON holds exact dicts/lists/scalars, so dispatch on
+        # type() instead of walking an isinstance chain per value
         def decode(value: object):
-            if isinstance(value, dict):
-                if cls._is_ref_dict(value):
+            t = type(value)
+            if t in _SCALAR_TYPES:
+                return value
+            if t is dict:
+                # inlined ref-dict check; the len() guard skips both key
+                # probes for ordinary wide dicts (refs have 2 keys)
+                if len(value) <= 3 and "_table" in value and "_id" in value:
                     table = value.get("_table")
-                    rid = value.get("_id")
-                    mdl = registry.resolve(table) if isinstance(table, str) else None
-                    if mdl is not None and hasattr(mdl, "from_id"):
+                    if table in loaders:
+                        loader = loaders[table]
+                    else:
+                        mdl = registry_resolve(table) if isinstance(table, str) else None
+                        loader = getattr(mdl, "from_id", None) if mdl is not None else None
+                        loaders[table] = loader
+                    if loader is not None:
                         try:
-                            return mdl.from_id(rid)
+                            return loader(value.get("_id"))
                         except Exception:
                             return value
                 return {k: decode(v) for k, v in value.items()}
-            if isinstance(value, list):
+            if t is list:
                 return [decode(v) for v in value]
             return value
 
@@ -419,10 +732,20 @@ class SQLerModel(BaseModel):
     def _dump_with_relations(self) -> dict:
         visited: set[tuple[str, int]] = set()
 
+        # exact-type checks first: scalar leaves and plain containers are
+        # the overwhelming majority; isinstance only runs for model
+        # instances and container subclasses
         def encode(value: object):
-            from sqler.models.model import SQLerModel
-            from sqler.models.ref import as_ref
-
+            t = type(value)
+            if t in _SCALAR_TYPES:
+                return value
+            if t is dict:
+                # already a ref dict: validate minimally
+                if "_table" in value and "_id" in value:
+                    return {"_table": value["_table"], "_id": value["_id"]}
+                return {k: encode(v) for k, v in value.items()}
+            if t is list:
+                return [encode(v) for v in value]
             if isinstance(value, SQLerModel):
                 # avoid recursion: require saved child
                 if value._id is None:
@@ -430,7 +753,6 @@ class SQLerModel(BaseModel):
                 if (value.__class__._table, int(value._id)) not in visited:  # type: ignore[attr-defined]
                     visited.add((value.__class__._table, int(value._id)))  # type: ignore[attr-defined]
                 return as_ref(value)
-            # already a ref dict: validate minimally
             if isinstance(value, dict) and "_table" in value and "_id" in value:
                 return {"_table": value["_table"], "_id": value["_id"]}
             if isinstance(value, list):
@@ -441,9 +763,17 @@ class SQLerModel(BaseModel):
                 return value.model_dump()
             return value
 
+        # pydantic v2 stores declared fields in __dict__ (private attrs like
+        # _id live elsewhere), so iterating it skips the per-field getattr
+        # and model_dump's schema walk; scalars bypass encode() entirely
         payload: dict = {}
-        for name in self.__class__.model_fields:
-            if name == "_id":
-                continue
-            payload[name] = encode(getattr(self, name))
+        for name, value in self.__dict__.items():
+            if value is None or type(value) in (int, float, str, bool):
+                payload[name] = value
+            elif self._holds_refs(value):
+                payload[name] = encode(value)
+            else:
+                # ref-free containers go in by reference; they are serialized
+                # immediately, so no defensive copy is needed
+                payload[name] = value
         return payload
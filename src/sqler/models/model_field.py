@@ -1,81 +1,131 @@
 from __future__ import annotations
 
-from typing import Any, List, Sequence, Type, Union
+import functools
+from typing import Any, Sequence, Tuple, Type, Union
 
 from sqler.models.model import SQLerModel
 from sqler.query.expression import SQLerExpression
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_tables(model: type, first: str) -> tuple[str, str]:
+    """Map (outer model, first path segment) to (related, outer) table names.
+
+    The registry lookup and pluralization fallback were re-run for every
+    predicate; they only depend on the model class and the leading path
+    segment, so memoize per pair. Assumes models are bound via ``set_db``
+    before relationship queries run (the registry is append-only at startup).
+    """
+    try:
+        # prefer registry-known names
+        from sqler import registry as _reg
+
+        keys = set(_reg.tables().keys())
+        if first in keys:
+            table = first
+        elif f"{first}s" in keys:
+            table = f"{first}s"
+        elif first.lower().endswith("s"):
+            table = first.lower()
+        else:
+            table = f"{first.lower()}s"
+    except Exception:
+        table = first.lower() if first.lower().endswith("s") else f"{first.lower()}s"
+    outer_table = getattr(model, "_table", None) or model.__name__.lower() + "s"
+    return table, outer_table
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_exists_sql(
+    outer_table: str,
+    rel_table: str,
+    first: str,
+    json_rest: str,
+    op: str,
+    has_rest: bool,
+    array_any: bool,
+) -> str:
+    """Render the relationship subquery for one predicate shape.
+
+    Query-heavy workloads emit the same handful of shapes over and over;
+    only the bound value changes, so the string assembly is memoized on
+    everything except the parameter.
+
+    Scalar refs compile to an IN semi-join: SQLite materializes the
+    matching related ids once and probes that list per outer row, instead
+    of re-entering a correlated EXISTS probe for every candidate. Multi-
+    valued ``.any()`` refs keep the EXISTS form because they must expand
+    the per-row refs array with json_each.
+    """
+    where_right = f"json_extract(r.data, '${json_rest}') {op} ?" if has_rest else f"r._id {op} ?"
+    if array_any:
+        # iterate refs array: json_each over $.<first>, join related on ref._id
+        joins = (
+            f"json_each({outer_table}.data, '$.{first}') a "
+            f"JOIN {rel_table} r ON r._id = json_extract(a.value, '$._id')"
+        )
+        return f"EXISTS (SELECT 1 FROM {joins} WHERE {where_right})"
+    return (
+        f"json_extract({outer_table}.data, '$.{first}._id') IN "
+        f"(SELECT r._id FROM {rel_table} r WHERE {where_right})"
+    )
+
+
 class SQLerModelField:
     """Model-aware field that compiles relationship-crossing predicates.
 
     Example:
       SQLerModelField(User, ["address", "city"]) == "Kyoto"
-      -> EXISTS (
-           SELECT 1 FROM addresses r
-           WHERE r._id = json_extract(data, '$.address._id')
-             AND json_extract(r.data, '$.city') = ?
+      -> json_extract(users.data, '$.address._id') IN (
+           SELECT r._id FROM addresses r
+           WHERE json_extract(r.data, '$.city') = ?
          )
     """
 
+    __slots__ = ("model", "path", "array_any", "_segs", "_int_mask")
+
     def __init__(
         self, model: Type[SQLerModel], path: Sequence[Union[str, int]], array_any: bool = False
     ):
         self.model = model
-        self.path: List[Union[str, int]] = list(path)
+        # immutable, hashable, and shares storage when any() re-wraps it
+        self.path: Tuple[Union[str, int], ...] = tuple(path)
         self.array_any = array_any
+        # SoA layout of the path: stringified segments plus a bitmask of
+        # which positions are integer indices, so _build_exists renders the
+        # JSON path without per-segment isinstance checks
+        mask = 0
+        segs = []
+        for i, p in enumerate(self.path):
+            if isinstance(p, int):
+                mask |= 1 << i
+            segs.append(str(p))
+        self._segs: tuple[str, ...] = tuple(segs)
+        self._int_mask = mask
 
     def any(self) -> "SQLerModelField":
         """For list-of-refs fields: iterate over the array of refs."""
         return SQLerModelField(self.model, self.path, array_any=True)
 
     def _build_exists(self, op: str, val: Any) -> SQLerExpression:
-        if not self.path:
+        if not self._segs:
             raise ValueError("Empty path for model field")
-        first_raw = str(self.path[0])
+        first_raw = self._segs[0]
         if first_raw.startswith("['") and first_raw.endswith("']"):
             first = first_raw[2:-2]
         else:
             first = first_raw.strip("[]'\"")
-        # related table name is default-plural of field type's class; we rely on registry-set table on model
-        # find table by inspecting registry mapping done in set_db; use child model's _table
-        # fall back to pluralized field name if unknown
-        try:
-            # prefer registry-known names
-            from sqler import registry as _reg
-
-            keys = set(_reg.tables().keys())
-            if first in keys:
-                table = first
-            elif f"{first}s" in keys:
-                table = f"{first}s"
-            elif first.lower().endswith("s"):
-                table = first.lower()
-            else:
-                table = f"{first.lower()}s"
-        except Exception:
-            table = first.lower() if first.lower().endswith("s") else f"{first.lower()}s"
-
-        rest = self.path[1:]
-        json_rest = "".join((f"[{p}]" if isinstance(p, int) else f".{p}") for p in rest)
-        outer_table = getattr(self.model, "_table", None) or self.model.__name__.lower() + "s"
-        if self.array_any:
-            # iterate refs array: json_each over $.<first>, join related on ref._id
-            # EXISTS (SELECT 1 FROM json_each(outer.data,'$.first') a JOIN table r ON r._id = json_extract(a.value,'$._id') WHERE json_extract(r.data,'$.rest') OP ?)
-            joins = f"json_each({outer_table}.data, '$.{first}') a JOIN {table} r ON r._id = json_extract(a.value, '$._id')"
-            where_right = (
-                f"json_extract(r.data, '${json_rest}') {op} ?" if rest else f"r._id {op} ?"
-            )
-            sql = f"EXISTS (SELECT 1 FROM {joins} WHERE {where_right})"
-        else:
-            ref_json = f"$.{first}._id"
-            where_right = (
-                f"json_extract(r.data, '${json_rest}') {op} ?" if rest else f"r._id {op} ?"
-            )
-            sql = (
-                "EXISTS (SELECT 1 FROM "
-                f"{table} r WHERE r._id = json_extract({outer_table}.data, '{ref_json}') AND {where_right})"
-            )
+        # related table name is default-plural of field type's class; we rely
+        # on registry-set table on model, falling back to pluralized field
+        # name if unknown (memoized per (model, segment) pair)
+        table, outer_table = _resolve_tables(self.model, first)
+
+        mask = self._int_mask
+        json_rest = "".join(
+            f"[{s}]" if (mask >> i) & 1 else f".{s}" for i, s in enumerate(self._segs[1:], start=1)
+        )
+        has_rest = len(self._segs) > 1
+        sql = _build_exists_sql(outer_table, table, first, json_rest, op, has_rest, self.array_any)
         return SQLerExpression(sql, [val])
 
     def __compare(self, op: str, val: Any) -> SQLerExpression:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Generic, Optional, Type, TypeVar
+from typing import Any, ClassVar, Generic, Optional, Type, TypeVar
 
+from sqler import _json
 from sqler.query import SQLerExpression, SQLerQuery
 
 T = TypeVar("T")
 
+# batched ref fetches bind one ? per id; stay under SQLite's portable
+# 999-variable ceiling (hosts compiled with a higher limit still work)
+_IN_CHUNK = 999
+
 
 class SQLerQuerySet(Generic[T]):
     """Query wrapper that materializes model instances.
@@ -14,21 +19,50 @@ class SQLerQuerySet(Generic[T]):
     results into instances of the bound Pydantic model class.
     """
 
+    # Rows in our tables were validated when they were saved, so re-running
+    # pydantic validation on every read is redundant work. When this flag is
+    # set, scalar-only models are hydrated with ``model_construct`` instead.
+    # Flip it off (or use ``.validate(True)``) for tables written by other
+    # processes.
+    SQLER_TRUST_DB: ClassVar[bool] = True
+
+    # chained calls allocate a wrapper per link; no per-instance __dict__
+    __slots__ = ("_model_cls", "_query", "_resolve", "_validate")
+
     def __init__(
         self,
         model_cls: Type[T],
         query: SQLerQuery,
+        validate: bool = False,
     ) -> None:
         self._model_cls = model_cls
         self._query = query
         self._resolve = True
+        self._validate = validate
 
     def resolve(self, flag: bool) -> "SQLerQuerySet[T]":
         """Toggle relation hydration on result materialization (default True)."""
-        clone = self.__class__(self._model_cls, self._query)
+        clone = self.__class__(self._model_cls, self._query, validate=self._validate)
         clone._resolve = flag
         return clone
 
+    def validate(self, flag: bool = True) -> "SQLerQuerySet[T]":
+        """Force pydantic validation of fetched rows (default trusts the db)."""
+        clone = self.__class__(self._model_cls, self._query, validate=flag)
+        clone._resolve = self._resolve
+        return clone
+
+    def _use_construct(self) -> bool:
+        """True when rows can be hydrated without re-validation.
+
+        Requires the trust flag, no explicit ``validate`` request, and a
+        model whose fields are all scalars — nested models or containers
+        need ``model_validate`` to coerce dicts back into instances.
+        """
+        if self._validate or not self.SQLER_TRUST_DB:
+            return False
+        return not getattr(self._model_cls, "_has_refs", True)
+
     # chaining returns new wrappers
     def filter(self, expression: SQLerExpression) -> "SQLerQuerySet[T]":
         """Return a new queryset filtered by the expression."""
@@ -55,9 +89,27 @@ class SQLerQuerySet(Generic[T]):
                 docs = self._batch_resolve(docs)
             except Exception:
                 pass
-        results: list[T] = []
-        for d in docs:
-            inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+        if self._use_construct():
+            fast_load = getattr(self._model_cls, "_fast_load", None)
+            if fast_load is not None:
+                results: list[T] = [fast_load(d) for d in docs]
+            else:
+                field_names = tuple(self._model_cls.model_fields)  # type: ignore[attr-defined]
+                results = [
+                    self._model_cls.model_construct(  # type: ignore[attr-defined]
+                        **{k: d[k] for k in field_names if k in d}
+                    )
+                    for d in docs
+                ]
+        else:
+            # one pydantic-core call for the whole page beats validating
+            # row by row from python
+            list_adapter = getattr(self._model_cls, "_list_adapter", None)
+            if list_adapter is not None:
+                results = list_adapter.validate_python(docs)
+            else:
+                results = [self._model_cls.model_validate(d) for d in docs]  # type: ignore[attr-defined]
+        for inst, d in zip(results, docs):
             # attach db id if present but excluded from schema
             try:
                 inst._id = d.get("_id")  # type: ignore[attr-defined]
@@ -68,7 +120,6 @@ class SQLerQuerySet(Generic[T]):
                 inst._snapshot = snap  # type: ignore[attr-defined]
             except Exception:
                 pass
-            results.append(inst)
         return results
 
     def first(self) -> Optional[T]:
@@ -81,7 +132,17 @@ class SQLerQuerySet(Generic[T]):
                 d = self._batch_resolve([d])[0]
             except Exception:
                 pass
-        inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+        if self._use_construct():
+            fast_load = getattr(self._model_cls, "_fast_load", None)
+            if fast_load is not None:
+                inst = fast_load(d)
+            else:
+                field_names = tuple(self._model_cls.model_fields)  # type: ignore[attr-defined]
+                inst = self._model_cls.model_construct(  # type: ignore[attr-defined]
+                    **{k: d[k] for k in field_names if k in d}
+                )
+        else:
+            inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
         try:
             inst._id = d.get("_id")  # type: ignore[attr-defined]
             if "_version" in d:
@@ -96,6 +157,20 @@ class SQLerQuerySet(Generic[T]):
         """Return the count of matching rows."""
         return self._query.count()
 
+    def all_json(self) -> str:
+        """Return matching rows as one SQLite-built JSON array string.
+
+        Skips model materialization entirely. Scalar refs are spliced in
+        by SQLite (unless ``.resolve(False)`` was chained); list-of-refs
+        fields stay as ``{"_table", "_id"}`` stubs.
+        """
+        scalar_refs: tuple = ()
+        if self._resolve:
+            getter = getattr(self._model_cls, "_scalar_ref_tables", None)
+            if getter is not None:
+                scalar_refs = getter()
+        return self._query.all_json(scalar_refs=scalar_refs)
+
     # inspection
     def sql(self) -> str:
         """Return the underlying SELECT SQL string."""
@@ -139,16 +214,17 @@ class SQLerQuerySet(Generic[T]):
         for table, ids in refs_by_table.items():
             if not ids:
                 continue
-            placeholders = ",".join(["?"] * len(ids))
-            sql = f"SELECT _id, data FROM {table} WHERE _id IN ({placeholders})"
-            cur = adapter.execute(sql, list(ids))
-            rows = cur.fetchall()
-            for _id, data_json in rows:
-                import json
-
-                obj = json.loads(data_json)
-                obj["_id"] = _id
-                resolved[(table, int(_id))] = obj
+            id_list = list(ids)
+            for start in range(0, len(id_list), _IN_CHUNK):
+                chunk = id_list[start : start + _IN_CHUNK]
+                placeholders = ",".join(["?"] * len(chunk))
+                sql = f"SELECT _id, data FROM {table} WHERE _id IN ({placeholders})"
+                cur = adapter.execute(sql, chunk)
+                rows = cur.fetchall()
+                for _id, data_json in rows:
+                    obj = _json.loads(data_json)
+                    obj["_id"] = _id
+                    resolved[(table, int(_id))] = obj
 
         # replace in-doc refs with fetched payloads, per-document visited guard
         def make_replace():
@@ -7,6 +7,8 @@ from typing import Optional, Type, TypeVar
 
 from pydantic import PrivateAttr
 
+from sqler import _json
+
 from .model import SQLerModel
 from .queryset import SQLerQuerySet
 
@@ -34,8 +36,9 @@ class SQLerSafeModel(SQLerModel):
         Adds a ``_version`` column to the table if missing.
         """
         super().set_db(db, table)
-        # upgrade table to versioned
-        db._ensure_versioned_table(cls._table)  # type: ignore[arg-type]
+        # upgrade table to versioned (skipped when unbinding)
+        if db is not None:
+            db._ensure_versioned_table(cls._table)  # type: ignore[arg-type]
 
     @classmethod
     def from_id(cls: Type[TSafe], id_: int) -> Optional[TSafe]:  # type: ignore[override]
@@ -43,9 +46,15 @@ class SQLerSafeModel(SQLerModel):
         doc = db.find_document_with_version(table, id_)
         if doc is None:
             return None
-        inst = cls.model_validate(doc)  # type: ignore[call-arg]
-        inst._id = doc.get("_id")  # type: ignore[attr-defined]
-        inst._version = doc.get("_version", 0)  # type: ignore[attr-defined]
+        # pop the bookkeeping keys so validation never scans them as extras
+        version = doc.pop("_version", 0)
+        row_id = doc.pop("_id", None)
+        if not cls._has_refs:
+            inst = cls.model_construct(**{k: doc[k] for k in cls._field_names if k in doc})
+        else:
+            inst = cls.model_validate(doc)  # type: ignore[call-arg]
+        inst._id = row_id  # type: ignore[attr-defined]
+        inst._version = version  # type: ignore[attr-defined]
         return inst  # type: ignore[return-value]
 
     @classmethod
@@ -77,10 +86,14 @@ class SQLerSafeModel(SQLerModel):
         max_retries = 128
         base = 0.002  # seconds
 
+        # serialize once per payload change, not once per attempt: lock
+        # retries re-bind the same text to the same cached statement
+        payload_text = _json.dumps(target_payload)
+
         for attempt in range(max_retries):
             try:
-                new_id, new_version = db.upsert_with_version(
-                    table, self._id, target_payload, self._version
+                new_id, new_version = db.upsert_with_version_raw(
+                    table, self._id, payload_text, self._version
                 )
                 self._id = new_id
                 self._version = new_version
@@ -112,14 +125,17 @@ class SQLerSafeModel(SQLerModel):
                 if delta is not None:
                     rebased = _apply_numeric_scalar_deltas(rebased, delta)
                 target_payload = rebased
+                payload_text = _json.dumps(target_payload)
                 self._version = getattr(latest, "_version", 0)
                 try:
                     self._snapshot = {k: v for k, v in latest_payload.items()}  # type: ignore[attr-defined]
                 except Exception:
                     pass
 
-            # Exponential backoff with jitter
-            sleep = (base * (2 ** min(attempt, 10))) + (random.random() * 0.0005)
+            # Truncated exponential backoff with multiplicative jitter: the
+            # cap bounds worst-case waits and the 0.5-1.5x factor spreads
+            # competing writers apart instead of re-colliding them in sync
+            sleep = min(0.2, base * (2**attempt)) * (0.5 + random.random())
             time.sleep(sleep)
 
         raise StaleVersionError("save retries exhausted")
@@ -132,15 +148,19 @@ class SQLerSafeModel(SQLerModel):
         doc = db.find_document_with_version(table, self._id)
         if doc is None:
             raise LookupError(f"Row {self._id} not found for refresh")
-        fresh = cls.model_validate(doc)  # type: ignore[call-arg]
-        for fname in self.__class__.model_fields:
-            if fname == "_id":
-                continue
-            setattr(self, fname, getattr(fresh, fname))
-        self._id = doc.get("_id")
-        self._version = doc.get("_version", 0)
+        version = doc.pop("_version", 0)
+        row_id = doc.pop("_id", None)
+        if not cls._has_refs:
+            # trusted reload of a scalar-only model: no validation pass
+            self.__dict__.update({k: doc[k] for k in cls._field_names if k in doc})
+        else:
+            fresh = cls.model_validate(doc)  # type: ignore[call-arg]
+            for fname in cls._field_names:
+                setattr(self, fname, getattr(fresh, fname))
+        self._id = row_id
+        self._version = version
         try:
-            self._snapshot = {k: v for k, v in doc.items() if k not in {"_id", "_version"}}  # type: ignore[attr-defined]
+            self._snapshot = dict(doc)  # type: ignore[attr-defined]
         except Exception:
             pass
         return self
@@ -1,5 +1,6 @@
-from typing import Any, Optional, Self
+from typing import Any, Optional, Self, Sequence
 
+from sqler import _json
 from sqler.adapter.asynchronous import AsyncSQLiteAdapter
 from sqler.query.expression import SQLerExpression
 
@@ -83,7 +84,7 @@ class AsyncSQLerQuery:
             True,
         )
 
-    def _build_query(self, *, include_id: bool = False) -> tuple[str, list[Any]]:
+    def _build_query(self, *, include_id: bool = False) -> tuple[str, Sequence[Any]]:
         where = f"WHERE {self._expression.sql}" if self._expression else ""
         order = ""
         if self._order:
@@ -97,7 +98,7 @@ class AsyncSQLerQuery:
             select = "data"
         sql = f"SELECT {select} FROM {self._table} {where} {order} {limit}".strip()
         sql = " ".join(sql.split())
-        params = self._expression.params if self._expression else []
+        params = self._expression.params if self._expression else ()
         return sql, params
 
     @property
@@ -105,7 +106,7 @@ class AsyncSQLerQuery:
         return self._build_query()[0]
 
     @property
-    def params(self) -> list[Any]:
+    def params(self) -> Sequence[Any]:
         return self._build_query()[1]
 
     async def all(self) -> list[str]:
@@ -137,24 +138,20 @@ class AsyncSQLerQuery:
     async def all_dicts(self) -> list[dict[str, Any]]:
         if self._adapter is None:
             raise ConnectionError("No adapter set for query")
-        import json
-
         sql, params = self._build_query(include_id=True)
         cur = await self._adapter.execute(sql, params)
         rows = await cur.fetchall()
         await cur.close()
-        docs: list[dict[str, Any]] = []
-        for row in rows:
-            try:
-                _id, data_json = row[0], row[1]
-                ver = row[2] if self._include_version and len(row) > 2 else None
-            except Exception:
-                continue
-            obj = json.loads(data_json)
-            obj["_id"] = _id
-            if ver is not None:
-                obj["_version"] = ver
-            docs.append(obj)
+        if not rows:
+            return []
+        # splice the page into one JSON array and decode it with a single
+        # call instead of paying the decoder entry cost per row
+        docs: list[dict[str, Any]] = _json.loads("[" + ",".join(row[1] for row in rows) + "]")
+        include_version = self._include_version
+        for row, obj in zip(rows, docs):
+            obj["_id"] = row[0]
+            if include_version and len(row) > 2 and row[2] is not None:
+                obj["_version"] = row[2]
         return docs
 
     async def first_dict(self) -> Optional[dict[str, Any]]:
@@ -1,25 +1,124 @@
-from typing import Any, Optional, Self
+import itertools
+from typing import Any, Iterable, Optional, Self
 
 
 class SQLerExpression:
     """sql expression fragment with parameters; supports & for and, | for or, ~ for not"""
 
-    def __init__(self, sql: str, params: Optional[list[Any]] = None):
-        """init with sql fragment and param list; sql like "foo > ?" or "json_extract(data, '$.x') = ?" """
-        self.sql = sql
-        self.params = params or []
+    # built in bulk when filter chains compose; slots drop the per-instance
+    # __dict__ and speed attribute access. combinators store a node tree and
+    # defer string building to first .sql access, so chaining N filters moves
+    # O(N) bytes instead of re-copying the left side at every step
+    __slots__ = ("_sql", "_node", "params")
+
+    def __init__(self, sql: str, params: Optional[Iterable[Any]] = None):
+        """init with sql fragment and params; sql like "foo > ?" or "json_extract(data, '$.x') = ?"
+
+        params are stored as a tuple: immutable, lighter than a list, and
+        param-less fragments all share the empty tuple"""
+        self._sql = sql
+        self._node: Optional[tuple] = None
+        self.params: tuple[Any, ...] = tuple(params) if params else ()
+
+    @property
+    def sql(self) -> str:
+        """sql fragment string; materialized lazily for combined expressions"""
+        if self._sql is None:
+            self._sql = self._materialize()
+        return self._sql
+
+    def _materialize(self) -> str:
+        """render the node tree in one pass (iterative: deep chains should
+        not hit the recursion limit)"""
+        parts: list[str] = []
+        stack: list[Any] = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            elif item._sql is not None:
+                parts.append(item._sql)
+            elif item._node[0] == "NOT":
+                stack.extend([")", item._node[1], "NOT ("])
+            else:
+                op, left, right = item._node
+                stack.extend([")", right, f") {op} (", left, "("])
+        return "".join(parts)
+
+    def conjuncts(self) -> list[Self]:
+        """flatten the top-level AND spine into its operand expressions
+
+        each returned expression carries its own sql and params, so a
+        caller may reorder them and re-join with AND without breaking
+        parameter binding. non-AND expressions (leaves, ORs, NOTs) come
+        back as a single-element list."""
+        out: list[Self] = []
+        stack: list[Self] = [self]
+        while stack:
+            item = stack.pop()
+            node = item._node
+            if node is not None and node[0] == "AND":
+                # push right first so operands pop in left-to-right order
+                stack.extend((node[2], node[1]))
+            else:
+                out.append(item)
+        return out
+
+    def _combine(self, op: str, other: Self) -> Self:
+        new = self.__class__.__new__(self.__class__)
+        new._sql = None
+        new._node = (op, self, other)
+        new.params = self._merged_params(other)
+        return new
+
+    def _merged_params(self, other: Self) -> tuple[Any, ...]:
+        """concat params, reusing a side verbatim when the other is empty"""
+        if not other.params:
+            return self.params
+        if not self.params:
+            return other.params
+        return self.params + other.params
 
     def __and__(self, other: Self) -> Self:
         """combine two exprs with and; params concatenated"""
-        return self.__class__(f"({self.sql}) AND ({other.sql})", self.params + other.params)
+        return self._combine("AND", other)
 
     def __or__(self, other: Self) -> Self:
         """combine two exprs with or; params concatenated"""
-        return self.__class__(f"({self.sql}) OR ({other.sql})", self.params + other.params)
+        return self._combine("OR", other)
+
+    @classmethod
+    def all_of(cls, exprs: Iterable[Self]) -> Self:
+        """combine many exprs with and in one join; chained & copies the left
+        side's sql and params at every step (O(N^2) for N filters)"""
+        exprs = list(exprs)
+        if not exprs:
+            raise ValueError("all_of requires at least one expression")
+        if len(exprs) == 1:
+            return exprs[0]
+        sql = " AND ".join(f"({e.sql})" for e in exprs)
+        params = tuple(itertools.chain.from_iterable(e.params for e in exprs))
+        return cls(sql, params)
+
+    @classmethod
+    def any_of(cls, exprs: Iterable[Self]) -> Self:
+        """combine many exprs with or in one join; see all_of"""
+        exprs = list(exprs)
+        if not exprs:
+            raise ValueError("any_of requires at least one expression")
+        if len(exprs) == 1:
+            return exprs[0]
+        sql = " OR ".join(f"({e.sql})" for e in exprs)
+        params = tuple(itertools.chain.from_iterable(e.params for e in exprs))
+        return cls(sql, params)
 
     def __invert__(self) -> Self:
         """negate expr with not"""
-        return self.__class__(f"NOT ({self.sql})", self.params)
+        new = self.__class__.__new__(self.__class__)
+        new._sql = None
+        new._node = ("NOT", self)
+        new.params = self.params
+        return new
 
     def __eq__(self, other: object) -> bool:
         """equality for testing"""
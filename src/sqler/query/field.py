@@ -1,7 +1,114 @@
-from typing import Any, List, Optional, Tuple, Union
+import functools
+import re
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
+from sqler import _json
 from sqler.query import SQLerExpression
 
+# json keys that can go unquoted in a sqlite json path; compiled once at
+# import instead of per _json_path call
+_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_json_path(path: Tuple[Union[str, int], ...]) -> str:
+    """render a path tuple as a sqlite json path; memoized since the same
+    few paths recur for every comparison a schema ever builds
+      ex: ('a', 'b', 1, 'c') -> '$.a.b[1].c'
+    """
+    if not path:
+        return "$"
+    return "$" + "".join(_render_segment(segment) for segment in path)
+
+
+def _render_segment(segment: Union[str, int]) -> str:
+    # exact-type check: bool is an int subclass but never a valid path key
+    if type(segment) is int:
+        return f"[{segment}]"
+    # C-level pre-filter covers the common case (plain ascii keys); the
+    # regex only runs for oddball keys that may still be quotable as-is
+    if segment.isascii() and segment.isidentifier():
+        return f".{segment}"
+    if _IDENT_RE.match(segment) is None:
+        escaped = segment.replace('"', '\\"')
+        return f'."{escaped}"'
+    return f".{segment}"
+
+
+@functools.lru_cache(maxsize=2048)
+def _cmp_sql(path: Tuple[Union[str, int], ...], op: str) -> str:
+    """comparison template for a (path, op) pair; a schema only ever has a
+    handful of these, so every comparison after the first is a dict hit"""
+    return f"JSON_EXTRACT(data, '{_build_json_path(path)}') {op} ?"
+
+
+@functools.lru_cache(maxsize=2048)
+def _null_sql(path: Tuple[Union[str, int], ...], negate: bool) -> str:
+    """IS NULL / IS NOT NULL template; no param to bind"""
+    op = "IS NOT NULL" if negate else "IS NULL"
+    return f"JSON_EXTRACT(data, '{_build_json_path(path)}') {op}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_any_sql(
+    path: Tuple[Union[str, int], ...],
+    aliases: Tuple[Tuple[str, str], ...],
+    op: str,
+) -> str:
+    """EXISTS template for an any() chain without mid-chain where() filters.
+
+    ``aliases`` is the (alias, array_field) pair per .any(); filters carry
+    unhashable expressions and take the uncached path in
+    :class:`SQLerAnyExpression`.
+    """
+    array_keys = [field for _, field in aliases]
+    first_alias = aliases[0][0]
+    idx0 = path.index(array_keys[0])
+    base_json = _build_json_path(path[: idx0 + 1])
+    joins = [f"json_each(json_extract(data, '{base_json}')) AS {first_alias}"]
+    prev_alias = first_alias
+    for alias, array_key in aliases[1:]:
+        joins.append(f"json_each(json_extract({prev_alias}.value, '$.{array_key}')) AS {alias}")
+        prev_alias = alias
+    from_join = " JOIN ".join(joins)
+    where = f"json_extract({prev_alias}.value, '$.{path[-1]}') {op} ?"
+    return f"EXISTS (SELECT 1 FROM {from_join} WHERE {where})"
+
+
+@functools.lru_cache(maxsize=2048)
+def _contains_sql(path: Tuple[Union[str, int], ...]) -> str:
+    """EXISTS template for single-path contains()"""
+    return (
+        f"EXISTS (SELECT 1 FROM json_each(data, '{_build_json_path(path)}') "
+        f"WHERE json_each.value = ?)"
+    )
+
+
+# above this many values, isin binds one JSON array param instead of n
+# placeholders: constant SQL text (statement-cache friendly) and no O(n)
+# placeholder string
+_ISIN_JSON_THRESHOLD = 32
+
+
+@functools.lru_cache(maxsize=2048)
+def _isin_json_sql(path: Tuple[Union[str, int], ...]) -> str:
+    """EXISTS template for large isin(); values arrive as one JSON array"""
+    return (
+        f"EXISTS (SELECT 1 FROM json_each(data, '{_build_json_path(path)}') "
+        f"WHERE json_each.value IN (SELECT value FROM json_each(?)))"
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _isin_sql(path: Tuple[Union[str, int], ...], n: int) -> str:
+    """EXISTS template for isin(); only the bound values vary per call, so
+    cache the whole statement keyed by (path, value count)"""
+    placeholders = ", ".join(["?"] * n)
+    return (
+        f"EXISTS (SELECT 1 FROM json_each(data, '{_build_json_path(path)}') "
+        f"WHERE json_each.value IN ({placeholders}))"
+    )
+
 
 class SQLerField:
     """
@@ -45,56 +152,46 @@ class SQLerField:
       # -> (JSON_EXTRACT(data, '$.count') > ?) AND (JSON_EXTRACT(data, '$.count') < ?)
     """
 
+    # fields are built by the thousands in query-heavy loops; slots drop
+    # the per-instance __dict__
+    __slots__ = ("path", "alias_stack", "_jp")
+
     def __init__(
         self,
-        path: Union[str, List[Union[str, int]]],
+        path: Union[str, Sequence[Union[str, int]]],
         alias_stack: Optional[
             List[Union[tuple[str, str], tuple[str, str, Optional[SQLerExpression]]]]
         ] = None,
     ):
         """
-        path: a string (single field) or list of keys/indexes (deep/nested)
+        path: a string (single field) or sequence of keys/indexes (deep/nested)
           ex: 'level1'
           ex: ['level1','arr2',3,'field4'] (for data['level1']['arr2'][3]['field4'])
         alias_stack: stores (alias, array_field) for every .any() in the chain
           ex: [('a','arr1'), ('b','arr2')] for arr1[].arr2[]
         """
+        # tuples: immutable, cheap to extend a segment at a time, and usable
+        # directly as keys into the memoized SQL template caches
         if isinstance(path, str):
-            self.path: List[Union[str, int]] = [path]
+            self.path: Tuple[Union[str, int], ...] = (path,)
         else:
-            self.path = list(path)
+            self.path = tuple(path)
         self.alias_stack: List[
             Union[tuple[str, str], tuple[str, str, Optional[SQLerExpression]]]
         ] = alias_stack or []
+        # render eagerly: a field is almost always built to be compared at
+        # least once, and the cache makes repeat renders free anyway
+        self._jp: str = _build_json_path(self.path)
 
     def __repr__(self) -> str:
         return f"SQLerField({self.path!r}, alias_stack={self.alias_stack!r})"
 
     def _json_path(self) -> str:
         """
-        build a sqlite json path string
+        build a sqlite json path string (precomputed in __init__)
           ex: ['a', 'b', 1, 'c'] -> '$.a.b[1].c'
         """
-        import re
-
-        if not self.path:
-            return "$"
-
-        def needs_quoting(s: str) -> bool:
-            # quotes if not valid json key
-            return not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", s)
-
-        parts = ["$"]
-        for segment in self.path:
-            if isinstance(segment, int):
-                parts.append(f"[{segment}]")
-            else:
-                if needs_quoting(segment):
-                    escaped = segment.replace('"', '\\"')
-                    parts.append(f'."{escaped}"')
-                else:
-                    parts.append(f".{segment}")
-        return "".join(parts)
+        return self._jp
 
     def any(self) -> "SQLerAnyContext":
         """
@@ -126,13 +223,13 @@ class SQLerField:
           SQLerField(['a'])['b']  -> ['a','b']
           SQLerField(['arr'])[0]  -> ['arr',0]
         """
-        return SQLerField(self.path + [item], self.alias_stack)
+        return SQLerField(self.path + (item,), self.alias_stack)
 
     def __truediv__(self, other: str) -> "SQLerField":
         """
         alternative to __getitem__, lets you do field / 'b'
         """
-        return SQLerField(self.path + [other], self.alias_stack)
+        return SQLerField(self.path + (other,), self.alias_stack)
 
     def __compare(self, op: str, val: Any) -> SQLerExpression:
         """
@@ -141,15 +238,19 @@ class SQLerField:
         """
         if self.alias_stack:
             return SQLerAnyExpression(self.path, self.alias_stack, op, val)
-        expr = f"JSON_EXTRACT(data, '{self._json_path()}') {op} ?"
-        return SQLerExpression(expr, [val])
+        return SQLerExpression(_cmp_sql(self.path, op), [val])
 
     def __eq__(self, other: Any) -> SQLerExpression:
-        """field == value"""
+        """field == value (== None becomes IS NULL)"""
+        if other is None and not self.alias_stack:
+            # NULL = NULL is never true in SQL; emit IS NULL and skip the bind
+            return SQLerExpression(_null_sql(self.path, negate=False), [])
         return self.__compare("=", other)
 
     def __ne__(self, other: Any) -> SQLerExpression:
-        """field != value"""
+        """field != value (!= None becomes IS NOT NULL)"""
+        if other is None and not self.alias_stack:
+            return SQLerExpression(_null_sql(self.path, negate=True), [])
         return self.__compare("!=", other)
 
     def __gt__(self, other: Any) -> SQLerExpression:
@@ -174,9 +275,7 @@ class SQLerField:
           SQLerField('tags').contains('red')
           # -> EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE json_each.value = ?)
         """
-        json_path = self._json_path()
-        expr = f"EXISTS (SELECT 1 FROM json_each(data, '{json_path}') WHERE json_each.value = ?)"
-        return SQLerExpression(expr, [value])
+        return SQLerExpression(_contains_sql(self.path), [value])
 
     def isin(self, values: List[Any]) -> SQLerExpression:
         """
@@ -186,13 +285,10 @@ class SQLerField:
         """
         if not values:
             return SQLerExpression("0", [])
-        json_path = self._json_path()
-        placeholders = ", ".join("?" for _ in values)
-        expr = (
-            f"EXISTS (SELECT 1 FROM json_each(data, '{json_path}') "
-            f"WHERE json_each.value IN ({placeholders}))"
-        )
-        return SQLerExpression(expr, values)
+        if len(values) > _ISIN_JSON_THRESHOLD:
+            # one JSON-encoded param keeps the SQL text constant for big lists
+            return SQLerExpression(_isin_json_sql(self.path), [_json.dumps(list(values))])
+        return SQLerExpression(_isin_sql(self.path, len(values)), values)
 
     def like(self, pattern: str) -> SQLerExpression:
         """
@@ -200,8 +296,7 @@ class SQLerField:
           SQLerField('field1').like('a%')
           # -> JSON_EXTRACT(data, '$.field1') LIKE ?
         """
-        expr = f"JSON_EXTRACT(data, '{self._json_path()}') LIKE ?"
-        return SQLerExpression(expr, [pattern])
+        return SQLerExpression(_cmp_sql(self.path, "LIKE"), [pattern])
 
 
 class SQLerAnyExpression(SQLerExpression):
@@ -225,9 +320,11 @@ class SQLerAnyExpression(SQLerExpression):
       #   )
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
-        path: List[Union[str, int]],
+        path: Sequence[Union[str, int]],
         alias_stack: List[Union[tuple[str, str], tuple[str, str, Optional[SQLerExpression]]]],
         op: str,
         val: Any,
@@ -249,6 +346,12 @@ class SQLerAnyExpression(SQLerExpression):
                 a, f, w = entry  # type: ignore[misc]
                 norm.append((a, f, w))
 
+        # filter-free chains share a cached template; only the param differs
+        if all(w is None for _, _, w in norm):
+            aliases_t = tuple((alias, field) for alias, field, _ in norm)
+            super().__init__(_render_any_sql(tuple(path), aliases_t, op), [val])
+            return
+
         array_keys = [field for _, field, _ in norm]
         aliases = [alias for alias, _, _ in norm]
         last_field = path[-1]
@@ -260,8 +363,9 @@ class SQLerAnyExpression(SQLerExpression):
         # where does the arrays start in the path?
         first_array_key = array_keys[0]
         idx0 = path.index(first_array_key)
-        base = path[:idx0]  # all path before arrays (could be [])
-        base_json = "$" + "".join(f".{p}" for p in base + [first_array_key])
+        # path before the arrays plus the first array key, rendered with the
+        # shared quoting-aware builder
+        base_json = _build_json_path(tuple(path[: idx0 + 1]))
 
         first_alias = aliases[0]
         # first FROM: make a table out of the first array
@@ -314,6 +418,8 @@ def _scope_expr(expr: SQLerExpression, alias: str) -> Tuple[str, list[Any]]:
 class SQLerAnyContext:
     """Context for mid-chain filters on any(). Use .where(expr)."""
 
+    __slots__ = ("_field", "_alias")
+
     def __init__(self, field: SQLerField, alias: str):
         self._field = field
         self._alias = alias
@@ -334,7 +440,7 @@ class SQLerAnyContext:
         return self
 
     def __getitem__(self, item: Union[str, int]) -> SQLerField:
-        return SQLerField(self._field.path + [item], self._field.alias_stack)
+        return SQLerField(self._field.path + (item,), self._field.alias_stack)
 
     def __truediv__(self, other: str) -> SQLerField:
-        return SQLerField(self._field.path + [other], self._field.alias_stack)
+        return SQLerField(self._field.path + (other,), self._field.alias_stack)
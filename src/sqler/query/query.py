@@ -1,7 +1,71 @@
-from typing import Any, Optional, Self
+import functools
+from typing import Any, Optional, Self, Sequence
 
+from sqler import _json
 from sqler.adapter.abstract import AdapterABC
 from sqler.query import SQLerExpression
+from sqler.query.field import _build_json_path
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_sql(
+    table: str,
+    expr_sql: Optional[str],
+    order: Optional[str],
+    desc: bool,
+    limit: Optional[int],
+    include_id: bool,
+    include_version: bool,
+) -> str:
+    """Render a SELECT for a query shape; process-wide and memoized.
+
+    The same shapes (SQL with ``?`` placeholders) recur across many query
+    instances with only the bound params differing, so the key is all
+    cheap-to-hash strings/ints/bools.
+    """
+    if include_id:
+        select = "_id, data" + (", _version" if include_version else "")
+    else:
+        select = "data"
+    parts = ["SELECT", select, "FROM", table]
+    if expr_sql:
+        parts.append(f"WHERE {expr_sql}")
+    if order:
+        # run the dotted field through the shared quoting-aware path builder
+        # so unusual keys stay valid SQL and the text stays byte-stable for
+        # SQLite's prepared-statement cache
+        order_path = _build_json_path(tuple(order.split(".")))
+        parts.append(f"ORDER BY json_extract(data, '{order_path}')" + (" DESC" if desc else ""))
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+    return " ".join(parts)
+
+
+def _selectivity(expr: SQLerExpression) -> float:
+    """Rank a predicate for AND ordering; lower runs first.
+
+    SQLite evaluates WHERE terms in written order, so cheap, selective
+    tests (equality, NULL checks) should precede memberships, ranges and
+    LIKE scans. Scores: equality/NULL 0, IN 1, range/inequality 2,
+    prefix LIKE 3, infix LIKE 4; NOT adds 0.5; anything unrecognized
+    (OR branches, raw fragments) sits in the middle at 2.5.
+    """
+    node = expr._node
+    if node is not None:
+        if node[0] == "NOT":
+            return _selectivity(node[1]) + 0.5
+        return 2.5
+    sql = expr._sql
+    if sql.endswith(" = ?") or sql.endswith("NULL"):
+        return 0.0
+    if " IN " in sql:
+        return 1.0
+    if sql.endswith((" > ?", " >= ?", " < ?", " <= ?", " != ?")):
+        return 2.0
+    if " LIKE " in sql:
+        first = expr.params[0] if expr.params else None
+        return 4.0 if isinstance(first, str) and first.startswith("%") else 3.0
+    return 2.5
 
 
 class QueryError(Exception):
@@ -45,6 +109,9 @@ class SQLerQuery:
         self._desc = desc
         self._limit = limit
         self._include_version = include_version
+        # built-statement cache: queries are immutable once constructed, so
+        # sql/params/all/count can share one render per select shape
+        self._built: dict[tuple[bool, bool], tuple[str, Sequence[Any]]] = {}
 
     def filter(self, expression: SQLerExpression) -> Self:
         """Return a new query with the expression AND-ed in.
@@ -138,9 +205,45 @@ class SQLerQuery:
             True,
         )
 
+    def _where(self) -> tuple[Optional[str], tuple[Any, ...]]:
+        """Return the WHERE fragment and params, ordered by selectivity.
+
+        AND chains from ``filter``/``exclude`` are flattened and sorted so
+        the most selective predicates render (and therefore evaluate)
+        first, whatever order the caller chained them in. Each conjunct
+        carries its own params, so they move with their SQL. The sort is
+        stable: equal scores keep the written order.
+        """
+        expr = self._expression
+        if expr is None:
+            return None, ()
+        conjuncts = expr.conjuncts()
+        if len(conjuncts) < 2:
+            return expr.sql, expr.params
+        ordered = sorted(conjuncts, key=_selectivity)
+        sql = " AND ".join(f"({c.sql})" for c in ordered)
+        params = tuple(p for c in ordered for p in c.params)
+        return sql, params
+
+    def _build_parts(self) -> tuple[str, str, str, Sequence[Any]]:
+        """Build the reusable statement fragments.
+
+        Returns:
+            tuple: ``(where, order, limit, params)`` fragments; empty strings
+            when a clause does not apply.
+        """
+        where_sql, params = self._where()
+        where = f"WHERE {where_sql}" if where_sql else ""
+        order = ""
+        if self._order:
+            order_path = _build_json_path(tuple(self._order.split(".")))
+            order = f"ORDER BY json_extract(data, '{order_path}')" + (" DESC" if self._desc else "")
+        limit = f"LIMIT {self._limit}" if self._limit is not None else ""
+        return where, order, limit, params
+
     def _build_query(
         self, *, include_id: bool = False, include_version: bool = False
-    ) -> tuple[str, list[Any]]:
+    ) -> tuple[str, Sequence[Any]]:
         """Build the SELECT statement and parameters.
 
         Args:
@@ -148,24 +251,22 @@ class SQLerQuery:
                 ``data``.
 
         Returns:
-            tuple[str, list[Any]]: SQL string and parameter list.
+            tuple[str, Sequence[Any]]: SQL string and parameters.
         """
-        where = f"WHERE {self._expression.sql}" if self._expression else ""
-        order = ""
-        if self._order:
-            order = f"ORDER BY json_extract(data, '$.{self._order}')" + (
-                " DESC" if self._desc else ""
-            )
-        limit = f"LIMIT {self._limit}" if self._limit is not None else ""
-        if include_id:
-            select = "_id, data" + (
-                ", _version" if (include_version or self._include_version) else ""
-            )
-        else:
-            select = "data"
-        sql = f"SELECT {select} FROM {self._table} {where} {order} {limit}".strip()
-        sql = " ".join(sql.split())  # collapse double spaces
-        params = self._expression.params if self._expression else []
+        cached = self._built.get((include_id, include_version))
+        if cached is not None:
+            return cached
+        where_sql, params = self._where()
+        sql = _render_sql(
+            self._table,
+            where_sql,
+            self._order,
+            self._desc,
+            self._limit,
+            include_id,
+            include_version or self._include_version,
+        )
+        self._built[(include_id, include_version)] = (sql, params)
         return sql, params
 
     @property
@@ -174,11 +275,11 @@ class SQLerQuery:
         return self._build_query()[0]
 
     @property
-    def params(self) -> list[Any]:
+    def params(self) -> Sequence[Any]:
         """Return the current parameter list."""
         return self._build_query()[1]
 
-    def debug(self) -> tuple[str, list[Any]]:
+    def debug(self) -> tuple[str, Sequence[Any]]:
         """Return (sql, params) for debugging."""
         return self._build_query()
 
@@ -220,7 +321,8 @@ class SQLerQuery:
         """
         if self._adapter is None:
             raise NoAdapterError("No adapter set for query")
-        return self.limit(1).all()[0] if self.limit(1).all() else None
+        rows = self.limit(1).all()
+        return rows[0] if rows else None
 
     def count(self) -> int:
         """Return the count of matching rows.
@@ -230,8 +332,10 @@ class SQLerQuery:
         """
         if self._adapter is None:
             raise NoAdapterError("No adapter set for query")
-        sql, params = self._build_query()
-        count_sql = sql.replace("SELECT data", "SELECT count(*)")
+        # assemble from fragments: no string surgery on the data select, and
+        # no ORDER BY/LIMIT for SQLite to parse on an aggregate
+        where, _, _, params = self._build_parts()
+        count_sql = f"SELECT count(*) FROM {self._table} {where}".rstrip()
         cur = self._adapter.execute(count_sql, params)
         row = cur.fetchone()
         return int(row[0]) if row else 0
@@ -247,27 +351,66 @@ class SQLerQuery:
         """
         if self._adapter is None:
             raise NoAdapterError("No adapter set for query")
-        import json
-
         sql, params = self._build_query(include_id=True, include_version=False)
         cur = self._adapter.execute(sql, params)
         rows = cur.fetchall()
+        # bind the codec's loads once; _json already picks orjson when the
+        # speed extra is installed
+        loads = _json.loads
+        include_version = self._include_version
         docs: list[dict[str, Any]] = []
         for row in rows:
-            try:
-                _id, data_json = row[0], row[1]
-                ver = row[2] if self._include_version and len(row) > 2 else None
-            except Exception:
-                continue
+            _id, data_json = row[0], row[1]
             if data_json is None:
                 raise InvariantViolationError(f"Row {_id} in {self._table} has NULL data JSON")
-            obj = json.loads(data_json)
+            obj = loads(data_json)
             obj["_id"] = _id
-            if ver is not None:
-                obj["_version"] = ver
+            if include_version and len(row) > 2 and row[2] is not None:
+                obj["_version"] = row[2]
             docs.append(obj)
         return docs
 
+    def all_json(self, scalar_refs: Sequence[tuple[str, str]] = ()) -> str:
+        """Execute and return all matching rows as one JSON array string.
+
+        The array is aggregated by SQLite via ``json_group_array`` with
+        ``_id`` (and ``_version`` when selected) patched into each element,
+        so no per-row Python parsing or re-serialization happens.
+
+        Args:
+            scalar_refs: ``(field, related_table)`` pairs whose single-row
+                refs are spliced into each element by a correlated
+                subquery, so the payload matches what ``all_dicts`` plus
+                ref resolution would produce. A dangling or null ref keeps
+                the stored value as-is.
+
+        Raises:
+            NoAdapterError: If the query has no adapter.
+
+        Returns:
+            str: JSON array of matching documents (``"[]"`` when empty).
+        """
+        if self._adapter is None:
+            raise NoAdapterError("No adapter set for query")
+        inner, params = self._build_query(include_id=True)
+        set_expr = "json_set(t.data, '$._id', t._id"
+        if self._include_version:
+            set_expr += ", '$._version', t._version"
+        for fname, rtable in scalar_refs:
+            # json() re-tags the value so older SQLites that drop the JSON
+            # subtype across the subquery don't quote it as a string
+            set_expr += (
+                f", '$.{fname}', json(coalesce("
+                f"(SELECT json_set(r.data, '$._id', r._id) FROM {rtable} r"
+                f" WHERE r._id = json_extract(t.data, '$.{fname}._id')),"
+                f" json_extract(t.data, '$.{fname}')))"
+            )
+        set_expr += ")"
+        sql = f"SELECT json_group_array({set_expr}) FROM ({inner}) t"
+        cur = self._adapter.execute(sql, params)
+        row = cur.fetchone()
+        return row[0] if row and row[0] is not None else "[]"
+
     def first_dict(self) -> Optional[dict[str, Any]]:
         """Execute with ``LIMIT 1`` and return first parsed dict with ``_id``.
 
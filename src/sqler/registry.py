@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import sys
 from typing import Dict, Optional
 
 _REGISTRY: Dict[str, type] = {}
 
 
 def register(table: str, cls: type) -> None:
-    _REGISTRY[table] = cls
+    # interned keys make the dict probe's equality check a pointer compare
+    # for callers passing literals or other interned names
+    _REGISTRY[sys.intern(table)] = cls
 
 
 def resolve(table: str) -> Optional[type]:
@@ -1,5 +1,8 @@
+import asyncio
+
 import pytest
 
+from sqler.adapter import AsyncAdapterPool
 from sqler.query import SQLerField as F
 from sqler.query.async_query import AsyncSQLerQuery
 
@@ -15,6 +18,33 @@ async def test_async_adapter_connect_execute(async_adapter):  # use fixture
     assert row[0] == 1
 
 
+@pytest.mark.asyncio
+async def test_async_pool_acquire_across_tasks(tmp_path):
+    pool = AsyncAdapterPool.on_disk(str(tmp_path / "pool.db"), min_size=2, max_size=4)
+    await pool.connect()
+    try:
+        async with pool.acquire() as adapter:
+            await adapter.execute_commit(
+                "CREATE TABLE IF NOT EXISTS t (_id INTEGER PRIMARY KEY, data JSON NOT NULL)"
+            )
+
+        async def write(i: int):
+            async with pool.acquire() as adapter:
+                await adapter.execute_commit(
+                    "INSERT INTO t (data) VALUES (json(?))", ['{"i": %d}' % i]
+                )
+
+        await asyncio.gather(*(write(i) for i in range(8)))
+
+        async with pool.acquire() as adapter:
+            cur = await adapter.execute("SELECT count(*) FROM t")
+            row = await cur.fetchone()
+            await cur.close()
+        assert row[0] == 8
+    finally:
+        await pool.close()
+
+
 @pytest.mark.asyncio
 async def test_async_db_insert_find_and_query(async_db):  # use fixture
     _id = await async_db.insert_document("users", {"name": "Ada", "age": 36})
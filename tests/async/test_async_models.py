@@ -31,3 +31,31 @@ async def test_async_model_crud_and_query(async_db):
     finally:
         # Important if the class keeps a reference
         AUser.set_db(None)
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_save(async_db):
+    AUser.set_db(async_db)
+    try:
+        users = [AUser(name=f"user{i}", age=20 + i) for i in range(5)]
+        await AUser.bulk_save(users)
+        assert all(isinstance(u._id, int) for u in users)
+
+        # mixed batch: updates keep ids, new instances get fresh ones
+        users[0].age = 99
+        batch = [users[0], AUser(name="newcomer", age=18)]
+        await AUser.bulk_save(batch)
+        assert batch[0]._id == users[0]._id
+        assert isinstance(batch[1]._id, int)
+        refreshed = await AUser.from_id(users[0]._id)
+        assert refreshed.age == 99
+    finally:
+        AUser.set_db(None)
+
+
+@pytest.mark.asyncio
+async def test_set_db_none_unbinds(async_db):
+    AUser.set_db(async_db)
+    AUser.set_db(None)
+    with pytest.raises(RuntimeError, match="not bound"):
+        AUser._require_binding()
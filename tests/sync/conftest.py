@@ -1,8 +1,6 @@
-import json
-
 import pytest
 
-from sqler import SQLerDB, SQLiteAdapter
+from sqler import SQLerDB, SQLiteAdapter, _json
 from sqler.adapter.abstract import AdapterABC
 
 
@@ -12,6 +10,28 @@ class DummyAdapter(AdapterABC):
         self.return_value = []  # set the raw dicts or lists or values
         self.count = 0
 
+    @property
+    def return_value(self):
+        return self._return_value
+
+    @return_value.setter
+    def return_value(self, rows):
+        # serialize once at assignment instead of on every fetchall; rows
+        # are fixed for the lifetime of the dummy
+        self._return_value = rows
+        with_id = []
+        plain = []
+        for i in rows:
+            _id = i.get("_id") if isinstance(i, dict) else None
+            if isinstance(i, dict) and "_id" in i:
+                payload = {k: v for k, v in i.items() if k != "_id"}
+            else:
+                payload = i
+            with_id.append((_id, _json.dumps(payload)))
+            plain.append((_json.dumps(i),))
+        self._serialized_with_id = with_id
+        self._serialized_plain = plain
+
     def connect(self) -> None:
         pass
 
@@ -26,18 +46,10 @@ class DummyAdapter(AdapterABC):
                 # Support both SELECT data (single column) and SELECT _id, data (two columns)
                 lower_q = query.strip().lower()
                 if lower_q.startswith("select _id, data"):
-                    to_return = []
-                    for i in self.return_value:
-                        _id = i.get("_id") if isinstance(i, dict) else None
-                        if isinstance(i, dict) and "_id" in i:
-                            payload = {k: v for k, v in i.items() if k != "_id"}
-                        else:
-                            payload = i
-                        to_return.append((_id, json.dumps(payload)))
-                    return to_return
+                    return self._serialized_with_id
                 else:
                     # default single-column JSON string
-                    return [(json.dumps(i),) for i in self.return_value]
+                    return self._serialized_plain
 
             def fetchone(cur_self):
                 return (self.count,)
@@ -65,17 +77,42 @@ def dummy_adapter():
     return DummyAdapter()
 
 
+# Template snapshots: run the DDL once per session and restore the serialized
+# bytes into each test's fresh connection instead of re-running CREATE TABLE.
+_TEMPLATE_BYTES: dict[str, bytes] = {}
+
+
+def _adapter_template() -> bytes:
+    cached = _TEMPLATE_BYTES.get("adapter")
+    if cached is None:
+        adapter = SQLiteAdapter.in_memory(shared=False)
+        adapter.connect()
+        adapter.execute("""
+            CREATE TABLE oligos (
+                length INTEGER,
+                sequence STRING
+            );
+        """)
+        cached = _TEMPLATE_BYTES["adapter"] = adapter._conn().serialize()
+        adapter.close()
+    return cached
+
+
+def _db_template() -> bytes:
+    cached = _TEMPLATE_BYTES.get("db")
+    if cached is None:
+        db = SQLerDB.in_memory(shared=False)
+        db._ensure_table(table="oligos")
+        cached = _TEMPLATE_BYTES["db"] = db.adapter._conn().serialize()
+        db.close()
+    return cached
+
+
 @pytest.fixture(scope="function")
 def oligo_adapter():
     adapter = SQLiteAdapter.in_memory(shared=False)
     adapter.connect()
-
-    adapter.execute("""
-        CREATE TABLE oligos (
-            length INTEGER,
-            sequence STRING
-        );
-    """)
+    adapter._conn().deserialize(_adapter_template())
 
     yield adapter
 
@@ -85,8 +122,9 @@ def oligo_adapter():
 @pytest.fixture(scope="function")
 def oligo_db():
     db = SQLerDB.in_memory(shared=False)
-    table = "oligos"
-    db._ensure_table(table=table)
+    db.adapter._conn().deserialize(_db_template())
+    # the table came in with the snapshot; skip the ensure round-trip
+    db._ensured.add("oligos")
 
     yield db
 
@@ -143,3 +143,19 @@ def test_context_manager_rollback_on_exception(tmp_path):
     adapter2.connect()
     cursor = adapter2.execute("SELECT COUNT(*) FROM foo;")
     assert cursor.fetchone()[0] == 0
+
+
+def test_write_tx_commits_and_rolls_back():
+    adapter = SQLiteAdapter.in_memory(shared=False)
+    adapter.connect()
+    adapter.execute("CREATE TABLE t (x INTEGER);")
+    with adapter.write_tx():
+        adapter.execute("INSERT INTO t (x) VALUES (1);")
+    assert adapter.execute("SELECT count(*) FROM t;").fetchone()[0] == 1
+
+    with pytest.raises(ValueError):
+        with adapter.write_tx():
+            adapter.execute("INSERT INTO t (x) VALUES (2);")
+            raise ValueError("boom")
+    assert adapter.execute("SELECT count(*) FROM t;").fetchone()[0] == 1
+    adapter.close()
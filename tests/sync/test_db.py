@@ -1,6 +1,6 @@
 import pytest
 
-from sqler import NotConnectedError
+from sqler import NotConnectedError, SQLerDB
 
 
 def test_insert_and_find_document(oligo_db):
@@ -13,6 +13,12 @@ def test_insert_and_find_document(oligo_db):
     assert result["label"] == "sample-1"
     assert result["_id"] == doc_id
 
+    # one-statement variant returns the stored doc without a second SELECT
+    rid, stored = oligo_db.insert_and_return("oligos", {"sequence": "GGCC", "length": 4})
+    assert stored["sequence"] == "GGCC"
+    assert stored["_id"] == rid
+    assert oligo_db.find_document("oligos", rid) == stored
+
 
 def test_upsert_document(oligo_db):
     oligo = {"sequence": "TTAA", "length": 4}
@@ -111,3 +117,116 @@ def test_bulk_upsert_empty_list(oligo_db):
     assert result == []
     cur = oligo_db.adapter.execute("SELECT COUNT(*) FROM oligos;")
     assert cur.fetchone()[0] == 0
+
+
+def test_query_all_json_aggregates_in_sqlite(oligo_db):
+    for seq in ["A", "AC", "ACG"]:
+        oligo_db.insert_document("oligos", {"sequence": seq, "length": len(seq)})
+    import json
+
+    payload = oligo_db.query("oligos").all_json()
+    docs = json.loads(payload)
+    assert [d["sequence"] for d in docs] == ["A", "AC", "ACG"]
+    assert all("_id" in d for d in docs)
+
+
+def test_json_array_append_single_update(oligo_db):
+    doc_id = oligo_db.insert_document("oligos", {"sequence": "ACGT", "tags": ["a"]})
+    assert oligo_db.json_array_append("oligos", doc_id, "tags", "b") == 1
+    assert oligo_db.find_document("oligos", doc_id)["tags"] == ["a", "b"]
+
+    # creates the array when the field is missing
+    assert oligo_db.json_array_append("oligos", doc_id, "notes", {"n": 1}) == 1
+    assert oligo_db.find_document("oligos", doc_id)["notes"] == [{"n": 1}]
+
+    # missing row reports zero updates
+    assert oligo_db.json_array_append("oligos", 9999, "tags", "c") == 0
+
+
+def test_get_version_scalar_read(oligo_db):
+    doc_id = oligo_db.insert_document("oligos", {"sequence": "ACGT"})
+    assert oligo_db.get_version("oligos", doc_id) == 0
+    oligo_db.upsert_with_version("oligos", doc_id, {"sequence": "ACGTA"}, 0)
+    assert oligo_db.get_version("oligos", doc_id) == 1
+    assert oligo_db.get_version("oligos", 9999) is None
+
+
+def test_json_patch_partial_update(oligo_db):
+    doc_id = oligo_db.insert_document("oligos", {"sequence": "ACGT", "length": 4})
+    assert oligo_db.json_patch("oligos", doc_id, {"length": 5}) == 1
+    doc = oligo_db.find_document("oligos", doc_id)
+    assert doc["length"] == 5 and doc["sequence"] == "ACGT"
+
+    # CAS mode bumps and returns the new version
+    ver = oligo_db.get_version("oligos", doc_id)
+    assert oligo_db.json_patch("oligos", doc_id, {"length": 6}, expected_version=ver) == ver + 1
+    with pytest.raises(RuntimeError):
+        oligo_db.json_patch("oligos", doc_id, {"length": 7}, expected_version=ver)
+
+
+def test_transaction_batches_writes(oligo_db):
+    with oligo_db.transaction():
+        ids = [oligo_db.insert_document("oligos", {"sequence": "A" * i}) for i in range(5)]
+    assert all(oligo_db.find_document("oligos", i) for i in ids)
+
+    # errors roll the whole batch back
+    with pytest.raises(ValueError):
+        with oligo_db.transaction():
+            doomed = oligo_db.insert_document("oligos", {"sequence": "GATTACA"})
+            raise ValueError("boom")
+    assert oligo_db.find_document("oligos", doomed) is None
+
+
+def test_bulk_insert_documents(oligo_db):
+    docs = [{"sequence": "A" * i, "length": i} for i in range(10)]
+    ids = oligo_db.bulk_insert_documents("oligos", docs)
+    assert len(ids) == 10 and len(set(ids)) == 10
+    assert oligo_db.find_document("oligos", ids[3])["length"] == 3
+
+
+def test_create_index_extracted_column(oligo_db):
+    for i in range(20):
+        oligo_db.insert_document("oligos", {"sequence": "A" * i, "length": i})
+    oligo_db.create_index("oligos", "length", extracted=True)
+    # generated column is queryable by name and mirrors the JSON path
+    rows = oligo_db.adapter.execute("SELECT x_length FROM oligos WHERE x_length = 7;").fetchall()
+    assert [r[0] for r in rows] == [7]
+    # the expression index still serves ORM-generated json_extract queries
+    from sqler.query import SQLerField as F
+
+    q = oligo_db.query("oligos").filter(F("length") >= 10)
+    plan = " | ".join(str(tuple(r)) for r in q.explain_query_plan(oligo_db.adapter))
+    assert "idx_oligos_length" in plan
+    # idempotent
+    oligo_db.create_index("oligos", "length", extracted=True)
+
+
+def test_analyze_runs_after_write_threshold(oligo_db):
+    docs = [{"sequence": "A", "length": i} for i in range(oligo_db._ANALYZE_THRESHOLD)]
+    oligo_db.bulk_insert_documents("oligos", docs)
+    # crossing the threshold refreshed planner stats and reset the counter
+    row = oligo_db.adapter.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1';"
+    ).fetchone()
+    assert row is not None
+    assert oligo_db._writes_since_analyze["oligos"] == 0
+
+
+def test_json_array_append_bumps_version_in_fresh_process(tmp_path):
+    # regression: versioned-ness must come from the schema, not from the
+    # in-process cache, or the first append after a restart skips the bump
+    path = str(tmp_path / "versioned.db")
+    db = SQLerDB.on_disk(path)
+    doc_id, _ = db.upsert_with_version("oligos", None, {"sequence": "ACGT", "tags": ["a"]}, None)
+    db.close()
+
+    reopened = SQLerDB.on_disk(path)
+    assert reopened.json_array_append("oligos", doc_id, "tags", "b") == 1
+    assert reopened.get_version("oligos", doc_id) == 1
+    reopened.close()
+
+
+def test_find_document_on_unwritten_table_returns_none(oligo_db):
+    # read paths must create-on-demand like the write paths do
+    assert oligo_db.find_document("ghosts", 1) is None
+    assert oligo_db.find_document_raw("ghosts", 1) is None
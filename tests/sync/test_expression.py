@@ -21,7 +21,7 @@ def test_and():
     # should have a .sql that we can inspect
     assert combined.sql == f"({LEN_SQL}) AND ({TM_SQL})"
     # same with .params
-    assert combined.params == [20, 50]
+    assert combined.params == (20, 50)
 
 
 def test_or():
@@ -35,7 +35,7 @@ def test_or():
     # should have a .sql that we can inspect
     assert combined.sql == f"({LEN_SQL}) OR ({TM_SQL})"
     # same with .params
-    assert combined.params == [20, 50]
+    assert combined.params == (20, 50)
 
 
 def test_not():
@@ -47,7 +47,7 @@ def test_not():
     # should have a .sql that we can inspect
     assert negated.sql == f"NOT ({IS_SQL})"
     # same with .params
-    assert negated.params == []
+    assert negated.params == ()
 
 
 def test_str():
@@ -68,4 +68,27 @@ def test_chaining_expressions():
 
     expression = ((a | b) & c) & ~d
     assert expression.sql == f"((({LEN_SQL}) OR ({TM_SQL})) AND ({LIKE_SQL})) AND (NOT ({IS_SQL}))"
-    assert expression.params == [20, 50, "TTT%"]
+    assert expression.params == (20, 50, "TTT%")
+
+
+def test_all_of():
+    """tests n-ary and; should match the sql of chained & without the nesting"""
+    a = SQLerExpression(LEN_SQL, [20])
+    b = SQLerExpression(TM_SQL, [50])
+    c = SQLerExpression(LIKE_SQL, ["ACGT%"])
+    combined = SQLerExpression.all_of([a, b, c])
+
+    assert combined.sql == f"({LEN_SQL}) AND ({TM_SQL}) AND ({LIKE_SQL})"
+    assert list(combined.params) == [20, 50, "ACGT%"]
+    # single expression comes back as-is
+    assert SQLerExpression.all_of([a]) is a
+
+
+def test_any_of():
+    """tests n-ary or"""
+    a = SQLerExpression(LEN_SQL, [20])
+    b = SQLerExpression(IS_SQL)
+    combined = SQLerExpression.any_of([a, b])
+
+    assert combined.sql == f"({LEN_SQL}) OR ({IS_SQL})"
+    assert list(combined.params) == [20]
@@ -35,18 +35,29 @@ def test_contains_isin_sql_array():
         expression.sql
         == "EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE json_each.value = ?)"
     )
-    assert expression.params == ["exon"]
+    assert expression.params == ("exon",)
 
     expr2 = tag.isin(["exon", "intron", "utr"])
     assert expr2.sql == (
         "EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE json_each.value IN (?, ?, ?))"
     )
-    assert expr2.params == ["exon", "intron", "utr"]
+    assert expr2.params == ("exon", "intron", "utr")
 
     # Like stays the same since it’s not for arrays
     expr3 = tag.like("exon%")
     assert expr3.sql == "JSON_EXTRACT(data, '$.tags') LIKE ?"
-    assert expr3.params == ["exon%"]
+    assert expr3.params == ("exon%",)
+
+
+def test_none_comparisons_emit_is_null():
+    """== None / != None should become IS NULL checks with no bound param"""
+    tag = SQLerField("tag")
+    is_null = tag == None  # noqa: E711
+    assert is_null.sql == "JSON_EXTRACT(data, '$.tag') IS NULL"
+    assert is_null.params == ()
+    not_null = tag != None  # noqa: E711
+    assert not_null.sql == "JSON_EXTRACT(data, '$.tag') IS NOT NULL"
+    assert not_null.params == ()
 
 
 def test_fields_make_the_same_way():
@@ -63,7 +74,7 @@ def test_isin_empty():
     oligo_type = SQLerField("type")
     should_be_empty = oligo_type.isin([])
     assert should_be_empty.sql == "0"
-    assert should_be_empty.params == []
+    assert should_be_empty.params == ()
 
 
 def test_real_field_works_with_oligo_db(oligo_db):
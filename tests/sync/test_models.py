@@ -80,3 +80,82 @@ def test_model_add_index():
         User.add_index("age")
     finally:
         db.close()
+
+
+def test_bulk_save_assigns_ids_and_updates():
+    db = setup_db()
+    try:
+        users = [User(name=f"user{i}", age=20 + i) for i in range(5)]
+        User.bulk_save(users)
+        assert all(isinstance(u._id, int) for u in users)
+
+        # mixed batch: updates keep ids, new instances get fresh ones
+        users[0].age = 99
+        batch = [users[0], User(name="newcomer", age=18)]
+        User.bulk_save(batch)
+        assert batch[0]._id == users[0]._id
+        assert isinstance(batch[1]._id, int)
+        assert User.from_id(users[0]._id).age == 99
+    finally:
+        db.close()
+
+
+def test_trusted_hydration_and_validate_escape_hatch():
+    db = setup_db()
+    try:
+        User(name="A", age=20).save()
+        # a row written by someone who didn't validate
+        db.insert_document("users", {"name": "B", "age": "not-an-int"})
+
+        # trusted path hydrates without re-validating (scalar-only model)
+        results = User.query().order_by("name").all()
+        assert results[1].age == "not-an-int"
+
+        # escape hatch re-runs pydantic validation
+        import pydantic
+        import pytest
+
+        with pytest.raises(pydantic.ValidationError):
+            User.query().validate(True).all()
+    finally:
+        db.close()
+
+
+def test_trusted_hydration_runs_default_factories_per_instance():
+    from pydantic import Field, PrivateAttr
+
+    class Note(SQLerModel):
+        name: str
+        label: str = Field(default_factory=lambda: "fresh")
+        _seen: list = PrivateAttr(default_factory=list)
+
+    db = SQLerDB.in_memory(shared=False)
+    try:
+        Note.set_db(db)
+        Note(name="a").save()
+        Note(name="b").save()
+        # simulate schema evolution: a row written before 'label' existed
+        db.insert_document("notes", {"name": "c"})
+
+        a, b, c = Note.query().order_by("name").all()
+        # private factories must yield a fresh object per instance, not a
+        # bind-time sentinel or one list shared across rows
+        a._seen.append(1)
+        assert a._seen == [1] and b._seen == []
+        # field factory fills rows missing the key; no sentinel leaks in
+        assert c.label == "fresh"
+    finally:
+        db.close()
+
+
+def test_set_db_none_unbinds():
+    import pytest
+
+    db = setup_db()
+    db.close()
+    User.set_db(None)
+    try:
+        with pytest.raises(RuntimeError, match="not bound"):
+            User._require_binding()
+    finally:
+        setup_db().close()
@@ -25,17 +25,18 @@ def test_can_build_queries():
 
     # does it have the correct initial sql?
     assert q.sql == "SELECT data FROM oligos"
-    assert q.params == []
+    assert q.params == ()
 
     # can we construct sql?
     q = q.filter(expression1)
     assert q.sql == "SELECT data FROM oligos WHERE length > ?"
-    assert q.params == [20]
+    assert q.params == (20,)
 
-    # should return another query obj that we can chain
+    # should return another query obj that we can chain; the equality
+    # predicate sorts ahead of the range, with its param moving along
     q = q.filter(expression2)
-    assert q.sql == "SELECT data FROM oligos WHERE (length > ?) AND (sequence = ?)"
-    assert q.params == [20, "ACGT"]
+    assert q.sql == "SELECT data FROM oligos WHERE (sequence = ?) AND (length > ?)"
+    assert q.params == ("ACGT", 20)
 
 
 def test_limit_builds_sql(query_obj):
@@ -44,7 +45,7 @@ def test_limit_builds_sql(query_obj):
     expr = SQLerExpression("length > ?", [10])
     q2 = q.filter(expr).limit(5)
     assert q2.sql == "SELECT data FROM oligos WHERE length > ? LIMIT 5"
-    assert q2.params == [10]
+    assert q2.params == (10,)
 
 
 def test_order_by_builds_sql(query_obj):
@@ -56,7 +57,7 @@ def test_order_by_builds_sql(query_obj):
         q2.sql
         == "SELECT data FROM oligos WHERE sequence = ? ORDER BY json_extract(data, '$.sequence')"
     )
-    assert q2.params == ["ATGC"]
+    assert q2.params == ("ATGC",)
     q3 = q2.order_by("length", desc=True)
     assert "DESC" in q3.sql
 
@@ -40,8 +40,7 @@ def setup_oligos(oligo_db):
         },
         {"sequence": "NNNN", "length": 4, "tm": 0.0, "mass": 0.0, "tags": ["mixed"]},
     ]
-    for oligo in oligos:
-        oligo_db.insert_document("oligos", oligo)
+    oligo_db.bulk_insert_documents("oligos", oligos)
     return oligos
 
 
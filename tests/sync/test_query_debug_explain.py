@@ -12,7 +12,7 @@ def test_debug_returns_sql_and_params(oligo_db: SQLerDB):
 
     q = SQLerQuery(table="oligos", adapter=db.adapter).filter(F("length") >= 15)
     sql, params = q.debug()
-    assert "SELECT" in sql and params == [15]
+    assert "SELECT" in sql and params == (15,)
 
 
 def test_explain_query_plan_runs_and_returns_rows(oligo_db: SQLerDB):
@@ -22,3 +22,17 @@ def test_explain_query_plan_runs_and_returns_rows(oligo_db: SQLerDB):
     q = SQLerQuery(table="oligos", adapter=db.adapter).filter(F("length") >= 10)
     rows = q.explain_query_plan(db.adapter)
     assert isinstance(rows, list) and rows
+
+
+def test_order_by_indexed_field_walks_index(oligo_db: SQLerDB):
+    db = oligo_db
+    for i in range(30):
+        db.insert_document("oligos", {"sequence": "A" * i, "length": i})
+    db.create_index("oligos", "length")
+
+    # order_by must emit the same json_extract expression the index was
+    # built on, so SQLite walks the index instead of sorting
+    q = db.query("oligos").order_by("length").limit(5)
+    plan = " | ".join(str(tuple(row)) for row in q.explain_query_plan(db.adapter))
+    assert "idx_oligos_length" in plan
+    assert "TEMP B-TREE" not in plan
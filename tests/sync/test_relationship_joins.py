@@ -58,3 +58,50 @@ def test_relationship_join_exists_query():
 
     rich = User.query().filter(User.ref("orders").any().field("total") > 100).order_by("name").all()
     assert [u.name for u in rich] == ["Alice"]
+
+
+def test_relationship_city_filter_probes_by_primary_key():
+    db = SQLerDB.in_memory(shared=False)
+    Address.set_db(db)
+    User.set_db(db)
+
+    for i in range(20):
+        a = Address(city=f"city{i}", country="JP").save()
+        User(name=f"user{i}", address=a).save()
+
+    # the semi-join must materialize the matching address ids once (an
+    # uncorrelated list subquery), not rescan the address table per outer row
+    qs = User.query().filter(MF(User, ["address", "city"]) == "city5")
+    plan = " | ".join(str(tuple(row)) for row in qs.explain_query_plan(db.adapter))
+    assert "LIST SUBQUERY" in plan
+    assert "CORRELATED" not in plan
+    assert [u.name for u in qs.all()] == ["user5"]
+
+
+def test_scalar_ref_index_created_at_bind():
+    db = SQLerDB.in_memory(shared=False)
+    Address.set_db(db)
+    User.set_db(db)
+
+    names = [
+        row[0]
+        for row in db.adapter.execute(
+            "SELECT name FROM sqlite_master WHERE type='index';"
+        ).fetchall()
+    ]
+    assert "idx_users_address__id" in names
+
+    # write-heavy models can opt out of the bind-time index
+    class LogEntry(SQLerModel):
+        _auto_index_refs = False
+        message: str
+        address: Address | None = None
+
+    LogEntry.set_db(db)
+    names = [
+        row[0]
+        for row in db.adapter.execute(
+            "SELECT name FROM sqlite_master WHERE type='index';"
+        ).fetchall()
+    ]
+    assert not any("logentries" in n for n in names)
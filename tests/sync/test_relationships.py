@@ -38,3 +38,28 @@ def test_relationship_save_load_refresh():
     assert loaded.address.city == "Osaka"
 
     db.close()
+
+
+def test_all_json_splices_scalar_refs():
+    db = SQLerDB.in_memory(shared=False)
+    Address.set_db(db)
+    User.set_db(db)
+
+    addr = Address(city="Kyoto", country="JP").save()
+    User(name="Alice", address=addr).save()
+    User(name="Bob").save()
+
+    import json
+
+    docs = json.loads(User.query().all_json())
+    by_name = {d["name"]: d for d in docs}
+    # the related row replaces the {_table,_id} stub, with its _id patched in
+    assert by_name["Alice"]["address"] == {"city": "Kyoto", "country": "JP", "_id": addr._id}
+    assert by_name["Bob"]["address"] is None
+
+    # opting out of resolution keeps the raw stub
+    raw = json.loads(User.query().resolve(False).all_json())
+    stub = {d["name"]: d for d in raw}["Alice"]["address"]
+    assert stub == {"_table": Address._table, "_id": addr._id}
+
+    db.close()